@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 import os
 from pathlib import Path
 
+from .database import database_config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -48,11 +50,22 @@ INSTALLED_APPS = [
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework.authentication.TokenAuthentication',
+        # Token, user and Student/Teacher profile in one cached lookup
+        'quiz.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
+    # orjson/msgspec when installed, DRF's stdlib encoder otherwise
+    'DEFAULT_RENDERER_CLASSES': [
+        'quiz.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'quiz.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 MIDDLEWARE = [
@@ -93,15 +106,32 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+# Configured from DATABASE_URL; see backend/database.py for the profiles
 
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_config(os.environ, BASE_DIR),
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Per-process memory by default; set REDIS_URL to share it between workers
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -146,6 +176,27 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 LOGIN_REDIRECT_URL = '/api/'
 
+# Precomputed offline content rows are rebuilt on change, and at least this often
+OFFLINE_CONTENT_TTL_DAYS = 30
+
+# Delta downloads also re-send changes stamped this long before the client's
+# cursor, covering rows whose transaction committed after the cursor was issued
+OFFLINE_DELTA_OVERLAP_SECONDS = 5 * 60
+
+# Video progress heartbeats and view counts are buffered per worker and
+# written in batches this often (0 writes each one straight through)
+WRITE_BEHIND_FLUSH_SECONDS = 10
+
+# Cached catalog responses are keyed by content generation, so this only
+# bounds how long unused generations occupy the cache
+CATALOG_CACHE_SECONDS = 24 * 60 * 60
+
+# Token-authenticated users (with their profile) are cached this long;
+# logout and user/profile changes evict them sooner. Off (0) with the
+# per-process default cache: an eviction there only reaches the worker that
+# made it, so other workers would accept a logged-out token until expiry
+TOKEN_AUTH_CACHE_SECONDS = 60 if os.environ.get('REDIS_URL') else 0
+
 # CORS_ALLOWED_ORIGINS = [
 #     "http://localhost:3000",
 #     "http://127.0.0.1:3000",
@@ -0,0 +1,66 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+
+def token_cache_key(key):
+    # Hashed, and only the user is cached under it, so the cache never holds the token itself
+    return 'auth:token:' + hashlib.sha256(key.encode()).hexdigest()
+
+
+def user_cache_key(user_id):
+    return f'auth:user:{user_id}'
+
+
+def forget_token(key):
+    cache.delete(token_cache_key(key))
+
+
+def forget_user_tokens(user_id):
+    """Evict the cached authentication of a user's token, e.g. after the user or their profile changes.
+
+    The cache key is remembered per user when the token is cached, so this
+    needs no database query.
+    """
+    cache_key = cache.get(user_cache_key(user_id))
+    if cache_key is not None:
+        cache.delete_many([cache_key, user_cache_key(user_id)])
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication that loads the token, user and Student/Teacher profile in one query
+    and caches the user (with the profile) for TOKEN_AUTH_CACHE_SECONDS.
+
+    The views' `hasattr(request.user, 'student')` / `'teacher'` checks are
+    answered from the joined profiles without further queries. Deleting a
+    token (logout_view) or saving the user or a profile evicts the cached
+    entry (see quiz/signals.py). With TOKEN_AUTH_CACHE_SECONDS = 0 nothing
+    is cached and every request makes the one joined query.
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        timeout = settings.TOKEN_AUTH_CACHE_SECONDS
+        user = cache.get(cache_key) if timeout else None
+
+        if user is None:
+            try:
+                token = Token.objects.select_related('user', 'user__student', 'user__teacher').get(key=key)
+            except Token.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_('Invalid token.'))
+            user = token.user
+            if timeout and user.is_active:
+                cache.set_many({cache_key: user, user_cache_key(user.pk): cache_key}, timeout=timeout)
+        else:
+            # request.auth from the key the client sent; the cache never stores it
+            token = Token(key=key, user=user)
+
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (user, token)
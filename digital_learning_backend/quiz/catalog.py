@@ -0,0 +1,98 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.http import HttpResponse
+
+from .models import CatalogGeneration
+from .renderers import FastJSONRenderer
+
+# Cached content is grouped into namespaces, each with its own generation:
+# 'quizzes' (quizzes, questions, their teachers) and 'videos' (videos,
+# categories). Offline deltas carry the content version in their name and
+# never need invalidating.
+QUIZZES = 'quizzes'
+VIDEOS = 'videos'
+OFFLINE = 'offline'
+
+# How long a rebuild may hold the lock before another worker takes over
+REBUILD_LOCK_SECONDS = 30
+# How long a worker without the lock and without a stale copy waits for the rebuild
+REBUILD_WAIT_SECONDS = 5
+REBUILD_POLL_SECONDS = 0.05
+
+
+def catalog_generation(namespace=QUIZZES):
+    """Current generation of a namespace; every change to its content moves it forward.
+
+    The counter lives in the database rather than the cache: with the
+    default per-process cache, a bump made by the worker that handled an
+    edit would otherwise never reach the other workers.
+    """
+    try:
+        return CatalogGeneration.objects.values_list('generation', flat=True).get(namespace=namespace)
+    except CatalogGeneration.DoesNotExist:
+        # Seeded from the clock, so a counter lost to a database reset never
+        # comes back at a generation whose entries may still be cached
+        counter, _ = CatalogGeneration.objects.get_or_create(
+            namespace=namespace, defaults={'generation': time.time_ns()}
+        )
+        return counter.generation
+
+
+def bump_catalog_generation(namespace=QUIZZES):
+    """Invalidate every cached entry of a namespace at once (old generations simply stop being read)"""
+    if not CatalogGeneration.objects.filter(namespace=namespace).update(generation=F('generation') + 1):
+        catalog_generation(namespace)
+
+
+def cached_catalog(name, build, namespace=QUIZZES):
+    """Return the cached value of `build()` for the namespace's generation, building it at most once.
+
+    After an invalidation only the worker that wins the rebuild lock calls
+    build(); the others serve the previous generation's copy meanwhile, or,
+    with no copy at all, wait briefly for the rebuild. build() may return
+    None (e.g. no such quiz), which is not cached.
+    """
+    # Offline entries are versioned by name, so they skip the generation lookup
+    generation = catalog_generation(namespace) if namespace != OFFLINE else 0
+    key = f'catalog:{namespace}:{generation}:{name}'
+    latest_key = f'catalog:{namespace}:latest:{name}'
+
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock_key = f'{key}:lock'
+    if cache.add(lock_key, True, timeout=REBUILD_LOCK_SECONDS):
+        try:
+            value = build()
+            if value is not None:
+                cache.set_many({key: value, latest_key: value}, timeout=settings.CATALOG_CACHE_SECONDS)
+        finally:
+            cache.delete(lock_key)
+        return value
+
+    stale = cache.get(latest_key)
+    if stale is not None:
+        return stale
+
+    deadline = time.monotonic() + REBUILD_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(REBUILD_POLL_SECONDS)
+        value = cache.get(key)
+        if value is not None:
+            return value
+    # The rebuild is taking too long; build this one ourselves rather than fail
+    return build()
+
+
+def rendered_json(build):
+    """Wrap a payload builder so the cache holds the encoded JSON body"""
+    return lambda: FastJSONRenderer().render(build())
+
+
+def cached_json_response(name, build, namespace=QUIZZES):
+    """An HttpResponse of the cached JSON body of build(); on a hit no serializer or encoder runs"""
+    return HttpResponse(cached_catalog(name, rendered_json(build), namespace), content_type='application/json')
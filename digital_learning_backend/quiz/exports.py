@@ -0,0 +1,155 @@
+import csv
+import json
+import tempfile
+from datetime import datetime, time, timedelta
+
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Trim
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Rows fetched per database round trip, and rows per streamed chunk
+EXPORT_CHUNK_SIZE = 2000
+
+PROGRESS_HEADER = ['Student', 'Quiz', 'Score', 'Completed At', 'Offline Mode']
+
+# Typed columns of the NDJSON and Parquet exports, in order
+PROGRESS_COLUMNS = [
+    'student_id', 'student', 'quiz_id', 'quiz', 'attempt_number', 'score', 'completed_at', 'offline_attempt'
+]
+
+
+class Echo:
+    """Pseudo-buffer whose write() hands the written value straight back"""
+
+    def write(self, value):
+        return value
+
+
+def day_start(date):
+    """Midnight at the start of `date` in the current time zone"""
+    return timezone.make_aware(datetime.combine(date, time.min))
+
+
+def filter_attempts(queryset, params):
+    """Apply the export filters (quiz_id, start_date/end_date); raises ValueError on bad dates"""
+    quiz_id = params.get('quiz_id')
+    start_date = params.get('start_date')
+    end_date = params.get('end_date')
+
+    if quiz_id:
+        queryset = queryset.filter(quiz_id=quiz_id)
+
+    if start_date and end_date:
+        start = parse_date(start_date)
+        end = parse_date(end_date)
+        if start is None or end is None:
+            raise ValueError('dates must be YYYY-MM-DD')
+        # A half-open datetime range on the column itself (rather than
+        # completed_at__date) keeps the completed_at indexes usable
+        queryset = queryset.filter(
+            completed_at__gte=day_start(start),
+            completed_at__lt=day_start(end + timedelta(days=1))
+        )
+
+    return queryset
+
+
+def student_name():
+    """The student's full name as computed by User.get_full_name(), in SQL"""
+    return Trim(Concat('student__user__first_name', Value(' '), 'student__user__last_name'))
+
+
+def progress_rows(queryset):
+    """Yield (student_name, quiz_name, score, completed_at, offline_attempt) with one joined query"""
+    return queryset.annotate(
+        student_name=student_name()
+    ).values_list(
+        'student_name', 'quiz__name', 'score', 'completed_at', 'offline_attempt'
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def stream_progress_csv(queryset):
+    writer = csv.writer(Echo())
+    chunk = [writer.writerow(PROGRESS_HEADER)]
+
+    for student_name, quiz_name, score, completed_at, offline_attempt in progress_rows(queryset):
+        chunk.append(writer.writerow([
+            student_name,
+            quiz_name,
+            score,
+            completed_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'Yes' if offline_attempt else 'No'
+        ]))
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield ''.join(chunk)
+            chunk = []
+
+    if chunk:
+        yield ''.join(chunk)
+
+
+def progress_records(queryset):
+    """Yield typed rows in PROGRESS_COLUMNS order with one joined query"""
+    return queryset.annotate(
+        student_name=student_name(),
+        quiz_name=F('quiz__name')
+    ).values_list(
+        'student_id', 'student_name', 'quiz_id', 'quiz_name', 'attempt_number', 'score', 'completed_at', 'offline_attempt'
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def stream_progress_ndjson(queryset):
+    chunk = []
+    for record in progress_records(queryset):
+        row = dict(zip(PROGRESS_COLUMNS, record))
+        row['completed_at'] = row['completed_at'].isoformat()
+        chunk.append(json.dumps(row, ensure_ascii=False) + '\n')
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield ''.join(chunk)
+            chunk = []
+
+    if chunk:
+        yield ''.join(chunk)
+
+
+def progress_parquet_schema():
+    return pyarrow.schema([
+        ('student_id', pyarrow.int64()),
+        ('student', pyarrow.string()),
+        ('quiz_id', pyarrow.int64()),
+        ('quiz', pyarrow.string()),
+        ('attempt_number', pyarrow.int32()),
+        ('score', pyarrow.float64()),
+        ('completed_at', pyarrow.timestamp('us', tz='UTC')),
+        ('offline_attempt', pyarrow.bool_()),
+    ])
+
+
+def write_progress_parquet(queryset):
+    """Write the export to a temporary Parquet file, one row group per chunk; requires pyarrow"""
+    schema = progress_parquet_schema()
+    output = tempfile.TemporaryFile()
+
+    def write_row_group(writer, rows):
+        columns = zip(*rows)
+        writer.write_table(pyarrow.Table.from_pydict(dict(zip(PROGRESS_COLUMNS, columns)), schema=schema))
+
+    with pyarrow.parquet.ParquetWriter(output, schema) as writer:
+        chunk = []
+        for record in progress_records(queryset):
+            chunk.append(record)
+            if len(chunk) >= EXPORT_CHUNK_SIZE:
+                write_row_group(writer, chunk)
+                chunk = []
+        if chunk:
+            write_row_group(writer, chunk)
+
+    output.seek(0)
+    return output
@@ -0,0 +1,48 @@
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+# Write-behind buffers flushed by the background thread, in registration order
+_flushes = []
+_flusher = None
+_flusher_lock = threading.Lock()
+
+
+def register_flush(flush):
+    """Have `flush` run every WRITE_BEHIND_FLUSH_SECONDS and at exit; starts the thread on first use"""
+    global _flusher
+    if flush in _flushes:
+        return
+    with _flusher_lock:
+        if flush in _flushes:
+            return
+        _flushes.append(flush)
+        # Write what is left when the worker shuts down cleanly
+        atexit.register(flush)
+        if _flusher is None:
+            _flusher = threading.Thread(target=run_flusher, name='write-behind-flusher', daemon=True)
+            _flusher.start()
+
+
+def flush_all():
+    for flush in list(_flushes):
+        try:
+            flush()
+        except Exception:
+            logger.exception('Write-behind flush %s failed', flush.__qualname__)
+
+
+def run_flusher():
+    while True:
+        time.sleep(max(settings.WRITE_BEHIND_FLUSH_SECONDS, 1))
+        try:
+            flush_all()
+        finally:
+            # This thread is outside the request cycle, so recycle its connection here
+            close_old_connections()
@@ -0,0 +1,140 @@
+import threading
+from collections import OrderedDict
+
+from django.core.cache import cache
+
+from .models import Question, QuizAttempt
+from .offline import datetime_to_version
+from .rollups import rebuild_rollups
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Answer keys held in this process, most recently used last
+ANSWER_KEY_CACHE_SIZE = 256
+_answer_keys = OrderedDict()
+_answer_keys_lock = threading.Lock()
+
+
+def answer_key_cache_key(quiz):
+    # Question edits bump quiz.updated_at, so stale keys are never looked up again
+    return f'quiz:{quiz.id}:answer_key:{datetime_to_version(quiz.updated_at)}'
+
+
+def get_answer_key(quiz):
+    """Return {question_id: correct_answer} for a quiz without touching questions when cached"""
+    cache_key = answer_key_cache_key(quiz)
+
+    with _answer_keys_lock:
+        if cache_key in _answer_keys:
+            _answer_keys.move_to_end(cache_key)
+            return _answer_keys[cache_key]
+
+    answer_key = cache.get(cache_key)
+    if answer_key is None:
+        answer_key = {
+            str(question_id): correct_answer
+            for question_id, correct_answer in Question.objects.filter(
+                quiz_id=quiz.id
+            ).values_list('id', 'correct_answer')
+        }
+        cache.set(cache_key, answer_key)
+
+    with _answer_keys_lock:
+        _answer_keys[cache_key] = answer_key
+        while len(_answer_keys) > ANSWER_KEY_CACHE_SIZE:
+            _answer_keys.popitem(last=False)
+    return answer_key
+
+
+def invalidate_answer_key(quiz_id):
+    """Drop this process's cached keys for a quiz (other processes miss on the new revision)"""
+    prefix = f'quiz:{quiz_id}:answer_key:'
+    with _answer_keys_lock:
+        for cache_key in [key for key in _answer_keys if key.startswith(prefix)]:
+            del _answer_keys[cache_key]
+
+
+def grade(answer_key, answers):
+    """Score submitted answers against an answer key; returns (correct_count, total_questions, score)"""
+    total_questions = len(answer_key)
+    correct_count = sum(
+        1 for question_id, correct_answer in answer_key.items()
+        if answers.get(question_id) and answers.get(question_id) == correct_answer
+    )
+    score = (correct_count / total_questions * 100) if total_questions > 0 else 0
+    return correct_count, total_questions, score
+
+
+def encode_answer(answer):
+    """Single-letter answers become their code point; 0 means unanswered, -1 never matches"""
+    if not answer:
+        return 0
+    if isinstance(answer, str) and len(answer) == 1:
+        return ord(answer)
+    return -1
+
+
+def grade_batch(answer_key, answers_list):
+    """Score many submissions against one answer key in a single pass.
+
+    Returns a list of (correct_count, score) matching grade() for each
+    submission. Uses a NumPy matrix comparison when NumPy is installed.
+    """
+    question_ids = list(answer_key)
+    total_questions = len(question_ids)
+    if total_questions == 0:
+        return [(0, 0) for _ in answers_list]
+
+    key = [encode_answer(answer_key[question_id]) for question_id in question_ids]
+    # An empty correct answer can never be matched, as in grade()
+    key = [code if code > 0 else -2 for code in key]
+    submitted = [
+        [encode_answer(answers.get(question_id)) if isinstance(answers, dict) else 0 for question_id in question_ids]
+        for answers in answers_list
+    ]
+
+    if np is not None and submitted:
+        matrix = np.array(submitted, dtype=np.int32)
+        correct_counts = (matrix == np.array(key, dtype=np.int32)).sum(axis=1).tolist()
+    else:
+        correct_counts = [
+            sum(1 for code, expected in zip(row, key) if code == expected)
+            for row in submitted
+        ]
+
+    return [(correct, correct / total_questions * 100) for correct in correct_counts]
+
+
+def regrade_quiz(quiz, batch_size=2000):
+    """Recompute QuizAttempt.score for every attempt of a quiz; returns (checked, updated)"""
+    answer_key = get_answer_key(quiz)
+    attempts = QuizAttempt.objects.filter(quiz=quiz).only('id', 'answers', 'score').order_by('id')
+    checked = updated = 0
+
+    batch = []
+    for attempt in attempts.iterator(chunk_size=batch_size):
+        batch.append(attempt)
+        if len(batch) >= batch_size:
+            updated += _rescore(answer_key, batch, batch_size)
+            checked += len(batch)
+            batch = []
+    if batch:
+        updated += _rescore(answer_key, batch, batch_size)
+        checked += len(batch)
+
+    if updated:
+        rebuild_rollups(quiz.id)
+    return checked, updated
+
+
+def _rescore(answer_key, attempts, batch_size):
+    changed = []
+    for attempt, (_, score) in zip(attempts, grade_batch(answer_key, [attempt.answers for attempt in attempts])):
+        if attempt.score != score:
+            attempt.score = score
+            changed.append(attempt)
+    QuizAttempt.objects.bulk_update(changed, ['score'], batch_size=batch_size)
+    return len(changed)
@@ -0,0 +1,57 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+# (label, URL name, query params) of the endpoints served from cached response bytes
+ENDPOINTS = [
+    ('quiz list', 'quiz-list', {}),
+    ('video categories', 'video-categories', {}),
+    ('offline delta', 'offline-download', {'version': 0}),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures requests/second of the cached read endpoints with a cold cache (every request '
+        'serializes and encodes, as before the response cache) and with a warm one'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint and mode')
+
+    def handle(self, *args, **options):
+        user = User.objects.order_by('id').first()
+        if user is None:
+            raise CommandError('No users; seed the database first (e.g. manage.py setup_test_data)')
+
+        # Requests go through the full middleware stack, so they need an allowed host
+        host = next((host for host in settings.ALLOWED_HOSTS if host != '*'), 'localhost').lstrip('.')
+        client = APIClient(HTTP_HOST=host)
+        client.force_authenticate(user=user)
+        count = options['requests']
+
+        for label, url_name, params in ENDPOINTS:
+            path = reverse(url_name)
+            response = client.get(path, params)
+            if response.status_code != 200:
+                raise CommandError(f'{path} returned {response.status_code}')
+
+            rates = {}
+            for mode in ['cold', 'warm']:
+                start = time.perf_counter()
+                for _ in range(count):
+                    if mode == 'cold':
+                        cache.clear()
+                    response = client.get(path, params)
+                elapsed = time.perf_counter() - start
+                rates[mode] = count / elapsed
+
+            self.stdout.write(
+                f"{label:<18} cold {rates['cold']:8.1f} req/s   warm {rates['warm']:8.1f} req/s   "
+                f"x{rates['warm'] / rates['cold']:.1f}  ({len(response.content)} bytes)"
+            )
@@ -0,0 +1,58 @@
+import time
+from datetime import timedelta
+from statistics import median
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from quiz.exports import filter_attempts
+from quiz.models import Quiz, QuizAttempt, OfflineSession, Video, SyncLog, Student, Teacher, Enrollment
+
+
+class Command(BaseCommand):
+    help = (
+        'Prints the query plan and median run time of the hot lookups in quiz/views.py. '
+        'Run it before and after `migrate quiz` to compare plans with and without the indexes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=20, help='Executions timed per query')
+
+    def handle(self, *args, **options):
+        student = Student.objects.order_by('id').first()
+        teacher = Teacher.objects.order_by('id').first()
+        quiz = Quiz.objects.order_by('id').first()
+        video = Video.objects.select_related('category').order_by('id').first()
+        today = timezone.localdate()
+        date_range = {'start_date': str(today - timedelta(days=30)), 'end_date': str(today)}
+
+        queries = {
+            'get_offline_status attempts': QuizAttempt.objects.filter(student=student, is_synced=False),
+            'get_offline_status sessions': OfflineSession.objects.filter(student=student, is_synced=False),
+            'offline quizzes': Quiz.objects.filter(is_active=True, offline_available=True),
+            'video list': Video.objects.filter(
+                category__category_type=video.category.category_type if video else None,
+                difficulty=video.difficulty if video else None
+            ),
+            'student sync log': SyncLog.objects.filter(student=student).order_by('-created_at')[:20],
+            'dashboard page': filter_attempts(
+                QuizAttempt.objects.filter(
+                    Q(quiz__created_by=teacher) |
+                    Q(student_id__in=Enrollment.objects.filter(classroom__teacher=teacher).values('student_id'))
+                ),
+                date_range
+            ).order_by('-completed_at', '-id')[:100],
+            'quiz export': filter_attempts(QuizAttempt.objects.all(), {'quiz_id': quiz.id if quiz else None, **date_range}),
+        }
+
+        for name, queryset in queries.items():
+            timings = []
+            for _ in range(options['runs']):
+                start = time.perf_counter()
+                list(queryset.all())
+                timings.append(time.perf_counter() - start)
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{name}: {median(timings) * 1000:.2f} ms median'))
+            self.stdout.write(queryset.explain())
+            self.stdout.write('')
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz.models import Quiz
+from quiz.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the teacher dashboard rollups (QuizDailyStats, StudentQuizStats) from stored attempts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--quiz', type=int, help='Only rebuild the rollups of this quiz')
+
+    def handle(self, *args, **options):
+        quiz_id = options['quiz']
+        if quiz_id is not None and not Quiz.objects.filter(pk=quiz_id).exists():
+            raise CommandError(f'Quiz {quiz_id} does not exist')
+
+        written = rebuild_rollups(quiz_id)
+        self.stdout.write(self.style.SUCCESS(f'Wrote {written} rollup rows'))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from quiz.offline import rebuild_offline_content, refresh_expired_content
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuilds the precomputed offline content served by /api/offline/download/. '
+        'Run with --expired from cron (e.g. nightly) to refresh rows past OFFLINE_CONTENT_TTL_DAYS.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--expired', action='store_true', help='Only refresh rows past their expiry')
+
+    def handle(self, *args, **options):
+        if options['expired']:
+            count = refresh_expired_content()
+            self.stdout.write(self.style.SUCCESS(f'Refreshed {count} expired offline content items'))
+            return
+
+        count = rebuild_offline_content()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {count} offline content items'))
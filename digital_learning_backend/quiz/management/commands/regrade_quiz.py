@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz.grading import regrade_quiz
+from quiz.models import Quiz
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the score of every attempt of a quiz from its current answer key'
+
+    def add_arguments(self, parser):
+        parser.add_argument('quiz_id', type=int)
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        try:
+            quiz = Quiz.objects.get(pk=options['quiz_id'])
+        except Quiz.DoesNotExist:
+            raise CommandError(f"Quiz {options['quiz_id']} does not exist")
+
+        checked, updated = regrade_quiz(quiz, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Regraded {checked} attempts of "{quiz.name}", {updated} scores changed'))
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = (
+        'Checkpoints the WAL, refreshes planner statistics and, when enough pages are free, '
+        'vacuums an SQLite database. Meant to run from cron, e.g. nightly outside school hours.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--vacuum', action='store_true', help='Always VACUUM, whatever the free page ratio')
+        parser.add_argument(
+            '--vacuum-threshold', type=float, default=0.2,
+            help='VACUUM when at least this fraction of pages is free (default 0.2)'
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        if connection.vendor != 'sqlite':
+            raise CommandError(f"Database '{options['database']}' is {connection.vendor}, not SQLite")
+
+        with connection.cursor() as cursor:
+            # Fold the WAL back into the database file and truncate it, so it
+            # does not keep growing between quiet periods
+            cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            busy, wal_pages, checkpointed = cursor.fetchone()
+            if busy:
+                self.stdout.write(self.style.WARNING('Checkpoint was blocked by an open reader; WAL not truncated'))
+            else:
+                self.stdout.write(f'Checkpointed {checkpointed} of {wal_pages} WAL pages')
+
+            cursor.execute('ANALYZE')
+            self.stdout.write('Refreshed planner statistics')
+
+            cursor.execute('PRAGMA page_count')
+            page_count = cursor.fetchone()[0]
+            cursor.execute('PRAGMA freelist_count')
+            free_pages = cursor.fetchone()[0]
+            free_ratio = free_pages / page_count if page_count else 0
+
+            if options['vacuum'] or free_ratio >= options['vacuum_threshold']:
+                # VACUUM cannot run inside a transaction and rewrites the whole file
+                cursor.execute('VACUUM')
+                cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                self.stdout.write(f'Vacuumed, reclaiming {free_pages} of {page_count} pages')
+            else:
+                self.stdout.write(f'{free_pages} of {page_count} pages free, below the vacuum threshold')
+
+        self.stdout.write(self.style.SUCCESS('SQLite maintenance complete'))
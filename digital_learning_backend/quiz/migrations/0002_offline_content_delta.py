@@ -0,0 +1,43 @@
+# Generated by Django 5.2.6 on 2026-10-17 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="quiz",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.CreateModel(
+            name="ContentTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "content_type",
+                    models.CharField(
+                        choices=[("quiz", "Quiz"), ("video", "Video")], max_length=50
+                    ),
+                ),
+                ("content_id", models.IntegerField()),
+                ("deleted_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "unique_together": {("content_type", "content_id")},
+            },
+        ),
+    ]
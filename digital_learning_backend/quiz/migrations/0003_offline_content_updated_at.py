@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-17 22:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0002_offline_content_delta"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="offlinecontent",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
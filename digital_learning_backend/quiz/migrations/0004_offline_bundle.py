@@ -0,0 +1,45 @@
+# Generated by Django 5.2.6 on 2026-10-17 22:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0003_offline_content_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OfflineBundle",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("content_version", models.BigIntegerField()),
+                (
+                    "encoding",
+                    models.CharField(
+                        choices=[
+                            ("identity", "Identity"),
+                            ("gzip", "Gzip"),
+                            ("br", "Brotli"),
+                            ("zstd", "Zstandard"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("body", models.BinaryField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "unique_together": {("content_version", "encoding")},
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-17 22:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0004_offline_bundle"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="quizattempt",
+            name="client_attempt_id",
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name="quizattempt",
+            constraint=models.UniqueConstraint(
+                fields=("student", "client_attempt_id"), name="unique_client_attempt"
+            ),
+        ),
+    ]
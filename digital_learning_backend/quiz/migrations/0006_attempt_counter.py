@@ -0,0 +1,44 @@
+# Generated by Django 5.2.6 on 2026-10-17 22:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0005_quizattempt_client_attempt_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AttemptCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("last_attempt_number", models.PositiveIntegerField(default=0)),
+                (
+                    "quiz",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="quiz.quiz"
+                    ),
+                ),
+                (
+                    "student",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="quiz.student"
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("student", "quiz")},
+            },
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 5.2.6 on 2026-10-17 22:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0006_attempt_counter"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QuizDailyStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("attempt_count", models.PositiveIntegerField(default=0)),
+                ("offline_count", models.PositiveIntegerField(default=0)),
+                ("score_sum", models.FloatField(default=0)),
+                ("bucket_0", models.PositiveIntegerField(default=0)),
+                ("bucket_1", models.PositiveIntegerField(default=0)),
+                ("bucket_2", models.PositiveIntegerField(default=0)),
+                ("bucket_3", models.PositiveIntegerField(default=0)),
+                ("bucket_4", models.PositiveIntegerField(default=0)),
+                (
+                    "quiz",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="quiz.quiz",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("quiz", "date")},
+            },
+        ),
+        migrations.CreateModel(
+            name="StudentQuizStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("best_score", models.FloatField(default=0)),
+                ("attempt_count", models.PositiveIntegerField(default=0)),
+                ("offline_count", models.PositiveIntegerField(default=0)),
+                ("last_attempt_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "quiz",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="student_stats",
+                        to="quiz.quiz",
+                    ),
+                ),
+                (
+                    "student",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="quiz.student"
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("student", "quiz")},
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.6 on 2026-10-17 22:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0007_dashboard_rollups"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="offlinesession",
+            index=models.Index(
+                fields=["student", "is_synced"], name="session_student_synced_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="quiz",
+            index=models.Index(
+                fields=["offline_available", "is_active"],
+                name="quiz_offline_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="quizattempt",
+            index=models.Index(
+                fields=["student", "is_synced"], name="attempt_student_synced_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="quizattempt",
+            index=models.Index(
+                fields=["-completed_at", "-id"], name="attempt_completed_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="quizattempt",
+            index=models.Index(
+                fields=["quiz", "-completed_at"], name="attempt_quiz_completed_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="synclog",
+            index=models.Index(
+                fields=["student", "-created_at"], name="synclog_student_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                fields=["category", "difficulty"], name="video_category_difficulty_idx"
+            ),
+        ),
+    ]
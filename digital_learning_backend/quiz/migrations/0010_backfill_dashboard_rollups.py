@@ -0,0 +1,19 @@
+from django.db import migrations
+
+from quiz.rollups import rebuild_rollups
+
+
+def backfill_rollups(apps, schema_editor):
+    # Attempts stored before 0007 never went through record_attempts()
+    rebuild_rollups(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0009_catalog_generation"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
+from django.db.models import Avg, Count, F, Max, Prefetch, Q, Value
+from django.db.models.functions import Coalesce, Greatest
 from django.contrib.auth.models import User
 from django.utils import timezone
 
@@ -92,6 +94,10 @@ class Video(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # VideoListView's category and difficulty filters
+            models.Index(fields=['category', 'difficulty'], name='video_category_difficulty_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.category.category_type})"
@@ -138,10 +144,29 @@ class VideoProgress(models.Model):
 
 
 # EXISTING CLASSROOM MODELS (KEEP AS IS)
+class ClassRoomQuerySet(models.QuerySet):
+    def with_counts(self):
+        """Annotate the enrollment counts and average progress"""
+        return self.annotate(
+            num_students=Count('enrollments'),
+            num_active_students=Count('enrollments', filter=Q(enrollments__active=True)),
+            num_inactive_students=Count('enrollments', filter=Q(enrollments__active=False)),
+            avg_progress=Coalesce(Avg('enrollments__progress'), Value(0.0))
+        )
+
+    def with_stats(self):
+        """with_counts(), plus what ClassRoomSerializer nests selected and prefetched"""
+        return self.with_counts().select_related('teacher__user').prefetch_related(
+            Prefetch('enrollments', queryset=Enrollment.objects.select_related('student__user').order_by('id'))
+        )
+
+
 class ClassRoom(models.Model):
     name = models.CharField(max_length=100)
     teacher = models.ForeignKey(Teacher, on_delete=models.CASCADE, related_name='classes')
     students = models.ManyToManyField(Student, through='Enrollment')
+
+    objects = ClassRoomQuerySet.as_manager()
     
     def student_count(self):
         return self.students.count()
@@ -189,12 +214,19 @@ class Quiz(models.Model):
     subject = models.CharField(max_length=50)
     created_by = models.ForeignKey(Teacher, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     
     # ADD OFFLINE SUPPORT
     is_active = models.BooleanField(default=True)
     offline_available = models.BooleanField(default=True)
     time_limit = models.IntegerField(default=30)  # minutes
 
+    class Meta:
+        indexes = [
+            # Offline catalog and content rebuilds filter on both flags, the quiz list on offline_available alone
+            models.Index(fields=['offline_available', 'is_active'], name='quiz_offline_active_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -223,26 +255,142 @@ class QuizAttempt(models.Model):
     offline_attempt = models.BooleanField(default=False)
     is_synced = models.BooleanField(default=True)
     sync_attempts = models.IntegerField(default=0)
+    # Generated by the client so retried uploads of the same attempt are recognised
+    client_attempt_id = models.UUIDField(null=True, blank=True)
 
     class Meta:
         ordering = ['-completed_at']
         unique_together = ['student', 'quiz', 'attempt_number']
+        constraints = [
+            models.UniqueConstraint(fields=['student', 'client_attempt_id'], name='unique_client_attempt')
+        ]
+        indexes = [
+            # Pending-sync counts in get_offline_status
+            models.Index(fields=['student', 'is_synced'], name='attempt_student_synced_idx'),
+            # Dashboard keyset pages and date ranges, newest first
+            models.Index(fields=['-completed_at', '-id'], name='attempt_completed_idx'),
+            # Exports and the dashboard filtered to one quiz
+            models.Index(fields=['quiz', '-completed_at'], name='attempt_quiz_completed_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.pk and not self.attempt_number:
-            last_attempt = QuizAttempt.objects.filter(
-                student=self.student,
-                quiz=self.quiz
-            ).order_by('-attempt_number').first()
-            
-            self.attempt_number = (last_attempt.attempt_number + 1) if last_attempt else 1
-        
+            # The counter row stays locked until this insert commits, so
+            # concurrent submissions for the same student and quiz queue up
+            # instead of colliding on unique_together.
+            with transaction.atomic():
+                self.attempt_number = AttemptCounter.reserve(self.student_id, self.quiz_id)
+                super().save(*args, **kwargs)
+            return
+
+        if self.attempt_number:
+            # Numbered by the caller (e.g. the admin form): keep the counter
+            # ahead of it so it never hands the same number out later
+            with transaction.atomic():
+                AttemptCounter.observe(self.student_id, self.quiz_id, self.attempt_number)
+                super().save(*args, **kwargs)
+            return
+
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.student.user.username} - {self.quiz.name}"
 
 
+class AttemptCounter(models.Model):
+    """Last attempt number handed out per student and quiz"""
+    student = models.ForeignKey(Student, on_delete=models.CASCADE)
+    quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE)
+    last_attempt_number = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ['student', 'quiz']
+
+    @classmethod
+    def reserve(cls, student_id, quiz_id, count=1):
+        """Reserve `count` consecutive attempt numbers and return the first one.
+
+        Must run inside a transaction: the F() update row-locks the counter
+        until the caller's attempts are committed.
+        """
+        counters = cls.objects.filter(student_id=student_id, quiz_id=quiz_id)
+
+        if not counters.update(last_attempt_number=F('last_attempt_number') + count):
+            # First reservation: seed from attempts stored before counters existed
+            last = QuizAttempt.objects.filter(
+                student_id=student_id, quiz_id=quiz_id
+            ).aggregate(last=Max('attempt_number'))['last'] or 0
+            try:
+                with transaction.atomic():
+                    cls.objects.create(student_id=student_id, quiz_id=quiz_id, last_attempt_number=last + count)
+                return last + 1
+            except IntegrityError:
+                # Another worker created the counter first
+                counters.update(last_attempt_number=F('last_attempt_number') + count)
+
+        return counters.values_list('last_attempt_number', flat=True).get() - count + 1
+
+    @classmethod
+    def observe(cls, student_id, quiz_id, attempt_number):
+        """Raise the counter to at least `attempt_number`, for an attempt numbered outside reserve().
+
+        Without a counter row there is nothing to raise: the first reserve()
+        seeds from the stored attempts, this one included.
+        """
+        cls.objects.filter(student_id=student_id, quiz_id=quiz_id).update(
+            last_attempt_number=Greatest('last_attempt_number', Value(attempt_number))
+        )
+
+    def __str__(self):
+        return f"{self.student} - {self.quiz} (#{self.last_attempt_number})"
+
+
+class QuizDailyStats(models.Model):
+    """Per-quiz, per-day rollup of attempts, maintained as attempts are stored"""
+    quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE, related_name='daily_stats')
+    date = models.DateField()
+    attempt_count = models.PositiveIntegerField(default=0)
+    offline_count = models.PositiveIntegerField(default=0)
+    score_sum = models.FloatField(default=0)
+    # Score distribution: [0-20), [20-40), [40-60), [60-80), [80-100]
+    bucket_0 = models.PositiveIntegerField(default=0)
+    bucket_1 = models.PositiveIntegerField(default=0)
+    bucket_2 = models.PositiveIntegerField(default=0)
+    bucket_3 = models.PositiveIntegerField(default=0)
+    bucket_4 = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ['quiz', 'date']
+
+    def __str__(self):
+        return f"{self.quiz.name} - {self.date} ({self.attempt_count} attempts)"
+
+
+class StudentQuizStats(models.Model):
+    """Per-student, per-quiz rollup: best score and attempt count"""
+    student = models.ForeignKey(Student, on_delete=models.CASCADE)
+    quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE, related_name='student_stats')
+    best_score = models.FloatField(default=0)
+    attempt_count = models.PositiveIntegerField(default=0)
+    offline_count = models.PositiveIntegerField(default=0)
+    last_attempt_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ['student', 'quiz']
+
+    def __str__(self):
+        return f"{self.student} - {self.quiz.name} (best {self.best_score})"
+
+
+class CatalogGeneration(models.Model):
+    """Generation counter of a cached catalog namespace (see quiz/catalog.py)"""
+    namespace = models.CharField(max_length=20, unique=True)
+    generation = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.namespace} (generation {self.generation})"
+
+
 class StudentBadge(models.Model):
     student = models.ForeignKey(Student, on_delete=models.CASCADE)
     badge = models.ForeignKey(Badge, on_delete=models.CASCADE)
@@ -267,6 +415,11 @@ class OfflineSession(models.Model):
     is_synced = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     synced_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['student', 'is_synced'], name='session_student_synced_idx'),
+        ]
     
     def __str__(self):
         return f"Offline Session - {self.student.user.username} ({self.session_id[:8]})"
@@ -283,6 +436,7 @@ class OfflineContent(models.Model):
     cached_data = models.JSONField()
     cache_version = models.IntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     expires_at = models.DateTimeField()
     
     class Meta:
@@ -295,6 +449,41 @@ class OfflineContent(models.Model):
         return f"Offline {self.content_type} - {self.content_id}"
 
 
+class OfflineBundle(models.Model):
+    """Encoded full offline download, stored once per content version and encoding"""
+    content_version = models.BigIntegerField()
+    encoding = models.CharField(max_length=20, choices=[
+        ('identity', 'Identity'),
+        ('gzip', 'Gzip'),
+        ('br', 'Brotli'),
+        ('zstd', 'Zstandard')
+    ])
+    body = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['content_version', 'encoding']
+
+    def __str__(self):
+        return f"Offline bundle v{self.content_version} ({self.encoding})"
+
+
+class ContentTombstone(models.Model):
+    """Remember removed offline content so delta downloads can tell devices to drop it"""
+    content_type = models.CharField(max_length=50, choices=[
+        ('quiz', 'Quiz'),
+        ('video', 'Video')
+    ])
+    content_id = models.IntegerField()
+    deleted_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['content_type', 'content_id']
+
+    def __str__(self):
+        return f"Deleted {self.content_type} - {self.content_id}"
+
+
 class SyncLog(models.Model):
     """Log all sync operations"""
     student = models.ForeignKey(Student, on_delete=models.CASCADE)
@@ -315,6 +504,9 @@ class SyncLog(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['student', '-created_at'], name='synclog_student_created_idx'),
+        ]
     
     def __str__(self):
         return f"Sync {self.sync_type} - {self.status} ({self.student.user.username})"
@@ -0,0 +1,388 @@
+import gzip
+import json
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.http import parse_etags
+
+from .catalog import REBUILD_LOCK_SECONDS, REBUILD_POLL_SECONDS, REBUILD_WAIT_SECONDS
+from .models import Quiz, Video, OfflineContent, OfflineBundle, ContentTombstone
+from .renderers import FastJSONRenderer
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+# Key of the payload sections each offline content type is reported under
+CONTENT_KEYS = {'quiz': 'quizzes', 'video': 'videos'}
+
+# Encodings the full bundle is stored in, most preferred first
+COMPRESSORS = {}
+if brotli is not None:
+    COMPRESSORS['br'] = lambda body: brotli.compress(body, quality=11)
+if zstandard is not None:
+    COMPRESSORS['zstd'] = lambda body: zstandard.ZstdCompressor(level=19).compress(body)
+COMPRESSORS['gzip'] = lambda body: gzip.compress(body, compresslevel=9, mtime=0)
+COMPRESSORS['identity'] = lambda body: body
+
+
+def quiz_payload(quiz):
+    """Offline representation of a quiz (correct answers are never shipped)"""
+    return {
+        'id': str(quiz.id),
+        'name': quiz.name,
+        'subject': quiz.subject,
+        'time_limit': quiz.time_limit,
+        'questions': [
+            {
+                'id': str(question.id),
+                'text_en': question.text_en,
+                'text_pa': question.text_pa,
+                'options': question.options,
+            }
+            for question in quiz.questions.all()
+        ]
+    }
+
+
+def video_payload(video):
+    """Offline representation of a video with all language URLs"""
+    return {
+        'id': str(video.id),
+        'title': video.title,
+        'title_pa': video.title_pa,
+        'description': video.description,
+        'category': video.category.category_type,
+        'difficulty': video.difficulty,
+        'duration_minutes': video.duration_minutes,
+        'video_urls': {
+            'en': video.get_video_url('en'),
+            'hi': video.get_video_url('hi'),
+            'pa': video.get_video_url('pa'),
+        }
+    }
+
+
+def record_tombstone(content_type, content_id):
+    ContentTombstone.objects.update_or_create(content_type=content_type, content_id=content_id)
+
+
+def store_content(content_type, content_id, payload):
+    """Materialize one item's payload into OfflineContent.
+
+    Only a changed payload bumps cache_version and updated_at, and with them
+    the content version devices sync against; an unchanged one (a no-op
+    save, a TTL refresh) just has its expiry extended.
+    """
+    expires_at = timezone.now() + timedelta(days=settings.OFFLINE_CONTENT_TTL_DAYS)
+    content, created = OfflineContent.objects.get_or_create(
+        content_type=content_type,
+        content_id=content_id,
+        defaults={'cached_data': payload, 'expires_at': expires_at}
+    )
+    if created:
+        return content
+
+    # Compared as stored, i.e. after a JSON round trip
+    if content.cached_data == json.loads(json.dumps(payload)):
+        OfflineContent.objects.filter(pk=content.pk).update(expires_at=expires_at)
+        content.expires_at = expires_at
+    else:
+        content.cached_data = payload
+        content.cache_version += 1
+        content.expires_at = expires_at
+        content.save()
+    return content
+
+
+def remove_content(content_type, content_id):
+    deleted, _ = OfflineContent.objects.filter(content_type=content_type, content_id=content_id).delete()
+    if deleted:
+        record_tombstone(content_type, content_id)
+
+
+def refresh_quiz_content(quiz_id):
+    quiz = Quiz.objects.filter(
+        pk=quiz_id, is_active=True, offline_available=True
+    ).prefetch_related('questions').first()
+
+    if quiz is None:
+        remove_content('quiz', quiz_id)
+    else:
+        store_content('quiz', quiz.id, quiz_payload(quiz))
+
+
+def refresh_video_content(video_id):
+    video = Video.objects.filter(pk=video_id, offline_available=True).select_related('category').first()
+
+    if video is None:
+        remove_content('video', video_id)
+    else:
+        store_content('video', video.id, video_payload(video))
+
+
+REFRESHERS = {'quiz': refresh_quiz_content, 'video': refresh_video_content}
+
+
+def rebuild_offline_content():
+    """Rebuild every OfflineContent row from the ORM; returns the number of rows written"""
+    stored = set()
+
+    for quiz in Quiz.objects.filter(is_active=True, offline_available=True).prefetch_related('questions'):
+        store_content('quiz', quiz.id, quiz_payload(quiz))
+        stored.add(('quiz', quiz.id))
+
+    for video in Video.objects.filter(offline_available=True).select_related('category'):
+        store_content('video', video.id, video_payload(video))
+        stored.add(('video', video.id))
+
+    for content_type, content_id in OfflineContent.objects.values_list('content_type', 'content_id'):
+        if content_type in REFRESHERS and (content_type, content_id) not in stored:
+            remove_content(content_type, content_id)
+
+    return len(stored)
+
+
+def refresh_expired_content():
+    """Rebuild the rows past their expiry; run from cron via `rebuild_offline_content --expired`"""
+    refreshed = 0
+    for content_type, content_id in OfflineContent.objects.filter(
+        expires_at__lte=timezone.now()
+    ).values_list('content_type', 'content_id'):
+        if content_type in REFRESHERS:
+            REFRESHERS[content_type](content_id)
+            refreshed += 1
+    return refreshed
+
+
+def version_to_datetime(version):
+    return EPOCH + timedelta(microseconds=int(version))
+
+
+def datetime_to_version(value):
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def content_version():
+    """Microsecond timestamp of the most recent change to offline content (0 when empty)"""
+    latest = [
+        OfflineContent.objects.aggregate(latest=Max('updated_at'))['latest'],
+        ContentTombstone.objects.aggregate(latest=Max('deleted_at'))['latest'],
+    ]
+    latest = [value for value in latest if value is not None]
+    return datetime_to_version(max(latest)) if latest else 0
+
+
+def parse_cursor(params):
+    """Read the client's delta cursor from `since` (sync_timestamp) or `version`.
+
+    Returns None for a full download and raises ValueError on a malformed cursor.
+    """
+    since = params.get('since')
+    version = params.get('version')
+
+    if since:
+        cursor = parse_datetime(since)
+        if cursor is None:
+            raise ValueError(f"'{since}' is not a valid timestamp")
+        if timezone.is_naive(cursor):
+            cursor = timezone.make_aware(cursor, dt_timezone.utc)
+        return cursor
+
+    if version:
+        try:
+            return version_to_datetime(version)
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"'{version}' is not a valid content version")
+
+    return None
+
+
+def current_content_version():
+    """The version the download will be served at.
+
+    Expired rows are refreshed by the rebuild_offline_content command, not
+    on this (unauthenticated) request path.
+    """
+    version = content_version()
+    if version == 0:
+        # Nothing materialized yet (e.g. content created before the
+        # OfflineContent rows were signal-maintained): build it now rather
+        # than serve an empty catalog
+        version = materialize_content()
+    return version
+
+
+def materialize_content():
+    """Run the full rebuild once, however many downloads find the table empty at the same time"""
+    lock_key = 'offline:rebuild:lock'
+    if cache.add(lock_key, True, timeout=REBUILD_LOCK_SECONDS):
+        try:
+            rebuild_offline_content()
+        finally:
+            cache.delete(lock_key)
+        return content_version()
+
+    deadline = time.monotonic() + REBUILD_WAIT_SECONDS
+    while time.monotonic() < deadline and cache.get(lock_key):
+        time.sleep(REBUILD_POLL_SECONDS)
+    return content_version()
+
+
+def bundle_etag(version, since=None, encoding='identity'):
+    """Strong ETag for the stored full bundle, weak for delta responses (their sync_timestamp varies).
+
+    Each Content-Encoding of the bundle is a different representation, so
+    it gets its own strong ETag.
+    """
+    if since is not None:
+        return f'W/"offline-{version}-{datetime_to_version(since)}"'
+    if encoding == 'identity':
+        return f'"offline-{version}"'
+    return f'"offline-{version}-{encoding}"'
+
+
+def etag_content(etag):
+    """The part of an ETag that identifies the content, whatever its encoding"""
+    etag = etag.removeprefix('W/').strip('"')
+    for encoding in COMPRESSORS:
+        etag = etag.removesuffix(f'-{encoding}')
+    return etag
+
+
+def etag_matches(etag, if_none_match):
+    """Weak comparison, as If-None-Match requires; a bundle's ETag in any encoding matches"""
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    return '*' in etags or etag_content(etag) in {etag_content(tag) for tag in etags}
+
+
+def build_offline_content(since=None, version=None):
+    """Assemble the offline download from precomputed OfflineContent rows.
+
+    With `since`, only rows changed after it are returned, together with
+    tombstones for content removed after it.
+    """
+    sync_timestamp = timezone.now()
+    if version is None:
+        version = current_content_version()
+
+    contents = OfflineContent.objects.filter(content_type__in=CONTENT_KEYS).order_by('content_id')
+    tombstones = ContentTombstone.objects.all()
+
+    if since is not None:
+        # updated_at/deleted_at are stamped at save(), before commit, so a row
+        # from a longer transaction can commit with a stamp older than a cursor
+        # already handed out. Re-sending the overlap catches it; clients
+        # de-duplicate by id.
+        since = since - timedelta(seconds=settings.OFFLINE_DELTA_OVERLAP_SECONDS)
+        contents = contents.filter(updated_at__gt=since)
+        tombstones = tombstones.filter(deleted_at__gt=since)
+    else:
+        tombstones = tombstones.none()
+
+    offline_content = {
+        'quizzes': [],
+        'videos': [],
+        'deleted': {'quizzes': [], 'videos': []},
+        'sync_timestamp': sync_timestamp.isoformat(),
+        'version': version,
+        'delta': since is not None
+    }
+
+    present = set()
+    for content_type, content_id, cached_data in contents.values_list('content_type', 'content_id', 'cached_data'):
+        offline_content[CONTENT_KEYS[content_type]].append(cached_data)
+        present.add((content_type, content_id))
+
+    # Videos are listed newest first, like the video catalog
+    offline_content['videos'].reverse()
+
+    # A tombstone is stale if the same id has since been re-published
+    for content_type, content_id in tombstones.values_list('content_type', 'content_id'):
+        if (content_type, content_id) not in present:
+            offline_content['deleted'][CONTENT_KEYS[content_type]].append(str(content_id))
+
+    return offline_content
+
+
+def stored_bundle(version):
+    bodies = dict(
+        OfflineBundle.objects.filter(content_version=version).values_list('encoding', 'body')
+    )
+    if set(COMPRESSORS) <= set(bodies):
+        return {encoding: bytes(body) for encoding, body in bodies.items()}
+    return None
+
+
+def get_offline_bundle(version):
+    """Return {encoding: body} for the full download at `version`, building it once.
+
+    The maximum-level compression is slow, so only the request that wins
+    the build lock compresses; concurrent requests for the same version
+    wait for its stored bundle instead of compressing it again.
+    """
+    bodies = stored_bundle(version)
+    if bodies is not None:
+        return bodies
+
+    lock_key = f'offline:bundle:{version}:lock'
+    if cache.add(lock_key, True, timeout=REBUILD_LOCK_SECONDS):
+        try:
+            return build_offline_bundle(version)
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + REBUILD_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(REBUILD_POLL_SECONDS)
+        bodies = stored_bundle(version)
+        if bodies is not None:
+            return bodies
+    # The build is taking too long; build this one ourselves rather than fail
+    return build_offline_bundle(version)
+
+
+def build_offline_bundle(version):
+    body = FastJSONRenderer().render(build_offline_content(version=version))
+    bodies = {encoding: compress(body) for encoding, compress in COMPRESSORS.items()}
+
+    OfflineBundle.objects.bulk_create(
+        [OfflineBundle(content_version=version, encoding=encoding, body=data) for encoding, data in bodies.items()],
+        ignore_conflicts=True
+    )
+    OfflineBundle.objects.exclude(content_version=version).delete()
+    return bodies
+
+
+def negotiate_encoding(accept_encoding):
+    """Pick the most preferred stored encoding the client accepts"""
+    accepted = set()
+    for part in accept_encoding.split(','):
+        coding, _, params = part.partition(';')
+        name, _, value = params.partition('=')
+        try:
+            quality = float(value) if name.strip() == 'q' else 1.0
+        except ValueError:
+            quality = 1.0
+        if quality > 0:
+            accepted.add(coding.strip().lower())
+
+    for encoding in COMPRESSORS:
+        if encoding in accepted or (encoding != 'identity' and '*' in accepted):
+            return encoding
+    return 'identity'
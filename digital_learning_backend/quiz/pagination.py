@@ -0,0 +1,59 @@
+import base64
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(completed_at, pk):
+    raw = json.dumps([completed_at.isoformat(), pk]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Return (completed_at, pk) from an opaque cursor; raises ValueError if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        completed_at, pk = json.loads(raw)
+        completed_at = parse_datetime(completed_at)
+    except (TypeError, ValueError, UnicodeDecodeError):
+        raise ValueError('Invalid cursor')
+    if completed_at is None or not isinstance(pk, int):
+        raise ValueError('Invalid cursor')
+    return completed_at, pk
+
+
+def parse_page_size(value):
+    if not value:
+        return DEFAULT_PAGE_SIZE
+    page_size = int(value)
+    if page_size < 1:
+        raise ValueError('page_size must be positive')
+    return min(page_size, MAX_PAGE_SIZE)
+
+
+def paginate_attempts(queryset, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """Keyset pagination over (completed_at, id), newest first.
+
+    Each page is one range scan starting after the cursor, so deep pages cost
+    the same as the first. Works on model and values() querysets alike.
+    Returns (attempts, next_cursor).
+    """
+    queryset = queryset.order_by('-completed_at', '-id')
+    if cursor:
+        completed_at, pk = decode_cursor(cursor)
+        queryset = queryset.filter(Q(completed_at__lt=completed_at) | Q(completed_at=completed_at, id__lt=pk))
+
+    attempts = list(queryset[:page_size + 1])
+    if len(attempts) <= page_size:
+        return attempts, None
+
+    attempts = attempts[:page_size]
+    last = attempts[-1]
+    # Pages of values() rows are dicts
+    if isinstance(last, dict):
+        return attempts, encode_cursor(last['completed_at'], last['id'])
+    return attempts, encode_cursor(last.completed_at, last.id)
@@ -0,0 +1,215 @@
+"""Read-only serializers for the list endpoints.
+
+Each function here builds the same output as its ModelSerializer
+counterpart (QuizSerializer, VideoSerializer, ClassRoomSerializer,
+StudentProgressSerializer) from `.values()` rows, so a list response
+creates no model instances and runs no per-field serializer code. Field
+order and value types match exactly; the contract tests in quiz/tests.py
+compare the encoded output of both. A field added to one of those
+serializers must be added here too.
+"""
+from collections import defaultdict
+
+from rest_framework import serializers
+
+from .models import Enrollment, Question, StudentBadge, Video
+
+USER_FIELDS = ['id', 'username', 'email', 'first_name', 'last_name']
+
+# Same formatting (timezone, DATETIME_FORMAT) as the ModelSerializers' DateTimeField
+format_datetime = serializers.DateTimeField().to_representation
+
+
+def user_values(prefix):
+    return [f'{prefix}__{field}' for field in USER_FIELDS]
+
+
+def user_row(row, prefix):
+    """UserSerializer output from the `<prefix>__<field>` columns of a values() row"""
+    return {field: row[f'{prefix}__{field}'] for field in USER_FIELDS}
+
+
+def full_name(row, prefix):
+    """User.get_full_name() from a values() row"""
+    return f"{row[f'{prefix}__first_name']} {row[f'{prefix}__last_name']}".strip()
+
+
+def group_by(rows, key):
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[row.pop(key)].append(row)
+    return grouped
+
+
+def quiz_rows(queryset):
+    """QuizSerializer(many=True) output for a Quiz queryset, in two queries"""
+    quizzes = list(queryset.prefetch_related(None).values(
+        'id', 'name', 'subject', 'created_at',
+        'created_by_id', 'created_by__subject', 'created_by__school', *user_values('created_by__user')
+    ))
+    questions = group_by(
+        Question.objects.filter(quiz_id__in=[quiz['id'] for quiz in quizzes]).order_by('id').values(
+            'id', 'quiz_id', 'subject', 'text_en', 'text_pa', 'options'
+        ),
+        'quiz_id'
+    )
+
+    return [
+        {
+            'id': quiz['id'],
+            'name': quiz['name'],
+            'subject': quiz['subject'],
+            'created_by': {
+                'id': quiz['created_by_id'],
+                'user': user_row(quiz, 'created_by__user'),
+                'subject': quiz['created_by__subject'],
+                'school': quiz['created_by__school'],
+            },
+            'created_at': format_datetime(quiz['created_at']),
+            'questions': questions.get(quiz['id'], []),
+        }
+        for quiz in quizzes
+    ]
+
+
+_video_files = {language: Video._meta.get_field(f'video_file_{language}').storage for language in ['en', 'hi', 'pa']}
+
+
+def video_url(video, language):
+    """Video.get_video_url() from a values() row"""
+    if language in ('hi', 'pa'):
+        if video[f'video_url_{language}']:
+            return video[f'video_url_{language}']
+        if video[f'video_file_{language}']:
+            return _video_files[language].url(video[f'video_file_{language}'])
+    if video['video_url_en']:
+        return video['video_url_en']
+    return _video_files['en'].url(video['video_file_en']) if video['video_file_en'] else ''
+
+
+def video_rows(queryset, language='en', progress_map=None):
+    """VideoSerializer(many=True) output for a Video queryset, in one query.
+
+    progress_map maps video id to a (completed, completion_percentage) pair
+    for the requesting student.
+    """
+    progress_map = progress_map or {}
+    videos = queryset.values(
+        'id', 'title', 'title_hi', 'title_pa', 'description', 'description_hi', 'description_pa',
+        'category__name', 'category__category_type', 'difficulty',
+        'video_url_en', 'video_url_hi', 'video_url_pa', 'video_file_en', 'video_file_hi', 'video_file_pa',
+        'duration_minutes', 'thumbnail_url', 'view_count', 'created_at'
+    )
+
+    rows = []
+    for video in videos:
+        completed, percentage = progress_map.get(video['id'], (False, 0.0))
+        rows.append({
+            'id': video['id'],
+            'title': video['title'],
+            'title_hi': video['title_hi'],
+            'title_pa': video['title_pa'],
+            'description': video['description'],
+            'description_hi': video['description_hi'],
+            'description_pa': video['description_pa'],
+            'category_name': video['category__name'],
+            'category_type': video['category__category_type'],
+            'difficulty': video['difficulty'],
+            'video_url': video_url(video, language),
+            'duration_minutes': video['duration_minutes'],
+            'thumbnail_url': video['thumbnail_url'],
+            'view_count': video['view_count'],
+            'is_completed': completed,
+            'progress_percentage': percentage,
+            'created_at': format_datetime(video['created_at']),
+        })
+    return rows
+
+
+def classroom_rows(queryset):
+    """ClassRoomSerializer(many=True) output for a queryset annotated by with_counts() or with_stats()"""
+    classrooms = list(queryset.prefetch_related(None).values(
+        'id', 'name', 'teacher_id', 'teacher__subject', 'teacher__school', *user_values('teacher__user'),
+        'num_students', 'num_active_students', 'num_inactive_students', 'avg_progress'
+    ))
+    enrollments = group_by(
+        Enrollment.objects.filter(classroom_id__in=[classroom['id'] for classroom in classrooms]).order_by('id').values(
+            'id', 'classroom_id', 'active', 'progress',
+            'student_id', 'student__grade', 'student__school', *user_values('student__user')
+        ),
+        'classroom_id'
+    )
+
+    return [
+        {
+            'id': classroom['id'],
+            'name': classroom['name'],
+            'teacher': {
+                'id': classroom['teacher_id'],
+                'user': user_row(classroom, 'teacher__user'),
+                'subject': classroom['teacher__subject'],
+                'school': classroom['teacher__school'],
+            },
+            'student_count': classroom['num_students'],
+            'active_students_count': classroom['num_active_students'],
+            'inactive_students_count': classroom['num_inactive_students'],
+            'average_progress': classroom['avg_progress'],
+            'enrollments': [
+                {
+                    'id': enrollment['id'],
+                    'student': {
+                        'id': enrollment['student_id'],
+                        'user': user_row(enrollment, 'student__user'),
+                        'grade': enrollment['student__grade'],
+                        'school': enrollment['student__school'],
+                    },
+                    'active': enrollment['active'],
+                    'progress': enrollment['progress'],
+                }
+                for enrollment in enrollments.get(classroom['id'], [])
+            ],
+        }
+        for classroom in classrooms
+    ]
+
+
+# Columns student_progress_rows() needs from each attempt row
+ATTEMPT_VALUES = ['id', 'student_id', 'student__user__first_name', 'student__user__last_name', 'score', 'completed_at']
+
+
+def student_progress_rows(attempts):
+    """StudentProgressSerializer(many=True) output for attempt rows selected with ATTEMPT_VALUES.
+
+    The badges of every student on the page come from one query.
+    """
+    badges = group_by(
+        StudentBadge.objects.filter(student_id__in={attempt['student_id'] for attempt in attempts}).values(
+            'student_id', 'badge_id', 'badge__name', 'badge__description', 'badge__image_url', 'awarded_at'
+        ),
+        'student_id'
+    )
+    badges = {
+        student_id: [
+            {
+                'badge': {
+                    'id': badge['badge_id'],
+                    'name': badge['badge__name'],
+                    'description': badge['badge__description'],
+                    'image_url': badge['badge__image_url'],
+                },
+                'awarded_at': format_datetime(badge['awarded_at']),
+            }
+            for badge in student_badges
+        ]
+        for student_id, student_badges in badges.items()
+    }
+
+    return [
+        {
+            'student_name': full_name(attempt, 'student__user'),
+            'score': attempt['score'],
+            'completed_at': format_datetime(attempt['completed_at']),
+            'badges': badges.get(attempt['student_id'], []),
+        }
+        for attempt in attempts
+    ]
@@ -0,0 +1,81 @@
+import codecs
+
+from django.conf import settings
+from rest_framework import renderers, parsers
+from rest_framework.exceptions import ParseError
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Types neither library encodes natively (Decimal, timedelta, lazy strings,
+# querysets...) get the same representation DRF's encoder gives them
+_drf_encoder = encoders.JSONEncoder()
+
+if orjson is not None:
+    JSON_BACKEND = 'orjson'
+    # UTC datetimes end in 'Z' like DRF's; int keys are stringified like the stdlib's
+    _options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def dumps(data):
+        return orjson.dumps(data, default=_drf_encoder.default, option=_options)
+
+    loads = orjson.loads
+    DecodeError = orjson.JSONDecodeError
+elif msgspec is not None:
+    JSON_BACKEND = 'msgspec'
+    _encoder = msgspec.json.Encoder(enc_hook=_drf_encoder.default)
+    _decoder = msgspec.json.Decoder()
+
+    dumps = _encoder.encode
+    loads = _decoder.decode
+    DecodeError = msgspec.DecodeError
+else:
+    JSON_BACKEND = None
+    dumps = loads = None
+    DecodeError = ValueError
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    """JSONRenderer that encodes with orjson or msgspec when installed.
+
+    Indented output (the browsable API, `; indent=` in Accept), ASCII-only
+    or non-compact output (UNICODE_JSON / COMPACT_JSON off) and a missing
+    library fall back to DRF's stdlib encoder, so responses are the same
+    either way.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (dumps is None or self.ensure_ascii or not self.compact
+                or self.get_indent(accepted_media_type or '', renderer_context or {})):
+            return super().render(data, accepted_media_type, renderer_context)
+        # U+2028/U+2029 are valid in JSON but end a line in older JavaScript; DRF escapes them too
+        return dumps(data).replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class FastJSONParser(parsers.JSONParser):
+    """JSONParser that decodes with orjson or msgspec when installed"""
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if loads is None:
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        try:
+            body = stream.read()
+            if codecs.lookup(encoding).name != 'utf-8':
+                body = body.decode(encoding).encode('utf-8')
+            return loads(body)
+        except (DecodeError, UnicodeError) as exc:
+            raise ParseError(f'JSON parse error - {exc}')
@@ -0,0 +1,214 @@
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Q, Sum
+from django.db.models.functions import Greatest, TruncDate
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .models import QuizAttempt, QuizDailyStats, StudentQuizStats
+
+BUCKET_COUNT = 5
+
+
+def score_bucket(score):
+    """Index of the 20-point distribution bucket a score falls in (100 goes in the top one)"""
+    return min(max(int(score // 20), 0), BUCKET_COUNT - 1)
+
+
+def upsert(model, lookup, updates, defaults):
+    """Apply F() `updates` to the row matching `lookup`, creating it from `defaults` if missing"""
+    if model.objects.filter(**lookup).update(**updates):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**lookup, **defaults)
+    except IntegrityError:
+        # Created concurrently; apply the increment to that row instead
+        model.objects.filter(**lookup).update(**updates)
+
+
+def record_attempts(attempts):
+    """Fold newly stored attempts into the dashboard rollups, one update per affected row"""
+    daily = defaultdict(lambda: {'attempt_count': 0, 'offline_count': 0, 'score_sum': 0.0, 'buckets': [0] * BUCKET_COUNT})
+    students = defaultdict(lambda: {'attempt_count': 0, 'offline_count': 0, 'best_score': None, 'last_attempt_at': None})
+
+    for attempt in attempts:
+        completed_at = attempt.completed_at or timezone.now()
+
+        day = daily[(attempt.quiz_id, timezone.localdate(completed_at))]
+        day['attempt_count'] += 1
+        day['offline_count'] += int(attempt.offline_attempt)
+        day['score_sum'] += attempt.score
+        day['buckets'][score_bucket(attempt.score)] += 1
+
+        student = students[(attempt.student_id, attempt.quiz_id)]
+        student['attempt_count'] += 1
+        student['offline_count'] += int(attempt.offline_attempt)
+        student['best_score'] = attempt.score if student['best_score'] is None else max(student['best_score'], attempt.score)
+        student['last_attempt_at'] = max(filter(None, [student['last_attempt_at'], completed_at]))
+
+    for (quiz_id, date), totals in daily.items():
+        buckets = {f'bucket_{i}': count for i, count in enumerate(totals['buckets'])}
+        upsert(
+            QuizDailyStats,
+            {'quiz_id': quiz_id, 'date': date},
+            {
+                'attempt_count': F('attempt_count') + totals['attempt_count'],
+                'offline_count': F('offline_count') + totals['offline_count'],
+                'score_sum': F('score_sum') + totals['score_sum'],
+                **{field: F(field) + count for field, count in buckets.items() if count},
+            },
+            {
+                'attempt_count': totals['attempt_count'],
+                'offline_count': totals['offline_count'],
+                'score_sum': totals['score_sum'],
+                **buckets,
+            }
+        )
+
+    for (student_id, quiz_id), totals in students.items():
+        upsert(
+            StudentQuizStats,
+            {'student_id': student_id, 'quiz_id': quiz_id},
+            {
+                'attempt_count': F('attempt_count') + totals['attempt_count'],
+                'offline_count': F('offline_count') + totals['offline_count'],
+                'best_score': Greatest('best_score', totals['best_score']),
+                'last_attempt_at': Greatest('last_attempt_at', totals['last_attempt_at']),
+            },
+            {
+                'attempt_count': totals['attempt_count'],
+                'offline_count': totals['offline_count'],
+                'best_score': totals['best_score'],
+                'last_attempt_at': totals['last_attempt_at'],
+            }
+        )
+
+
+def rebuild_rollups(quiz_id=None, apps=None):
+    """Recompute the rollups from QuizAttempt (all quizzes, or one); returns the rows written.
+
+    A data migration passes its `apps` registry so the historical models are used.
+    """
+    attempt_model, daily_model, student_model = (
+        [apps.get_model('quiz', name) for name in ('QuizAttempt', 'QuizDailyStats', 'StudentQuizStats')]
+        if apps is not None else [QuizAttempt, QuizDailyStats, StudentQuizStats]
+    )
+    attempts = attempt_model.objects.order_by()
+    if quiz_id is not None:
+        attempts = attempts.filter(quiz_id=quiz_id)
+
+    bucket_filters = [Q(score__lt=20)] + [
+        Q(score__gte=20 * i, score__lt=20 * (i + 1)) for i in range(1, BUCKET_COUNT - 1)
+    ] + [Q(score__gte=20 * (BUCKET_COUNT - 1))]
+
+    daily = [
+        daily_model(**row)
+        for row in attempts.annotate(date=TruncDate('completed_at')).values('quiz_id', 'date').annotate(
+            attempt_count=Count('id'),
+            offline_count=Count('id', filter=Q(offline_attempt=True)),
+            score_sum=Sum('score'),
+            **{f'bucket_{i}': Count('id', filter=bucket_filter) for i, bucket_filter in enumerate(bucket_filters)}
+        )
+    ]
+    students = [
+        student_model(**row)
+        for row in attempts.values('student_id', 'quiz_id').annotate(
+            best_score=Max('score'),
+            attempt_count=Count('id'),
+            offline_count=Count('id', filter=Q(offline_attempt=True)),
+            last_attempt_at=Max('completed_at')
+        )
+    ]
+
+    with transaction.atomic():
+        stale_daily = daily_model.objects.all()
+        stale_students = student_model.objects.all()
+        if quiz_id is not None:
+            stale_daily = stale_daily.filter(quiz_id=quiz_id)
+            stale_students = stale_students.filter(quiz_id=quiz_id)
+        stale_daily.delete()
+        stale_students.delete()
+
+        daily_model.objects.bulk_create(daily)
+        student_model.objects.bulk_create(students)
+
+    return len(daily) + len(students)
+
+
+def filter_daily_stats(queryset, params):
+    """Apply the dashboard filters (quiz_id, start_date/end_date) to QuizDailyStats; raises ValueError on bad dates"""
+    quiz_id = params.get('quiz_id')
+    start_date = params.get('start_date')
+    end_date = params.get('end_date')
+
+    if quiz_id:
+        queryset = queryset.filter(quiz_id=quiz_id)
+
+    if start_date and end_date:
+        start = parse_date(start_date)
+        end = parse_date(end_date)
+        if start is None or end is None:
+            raise ValueError('dates must be YYYY-MM-DD')
+        queryset = queryset.filter(date__range=[start, end])
+
+    return queryset
+
+
+def dashboard_summary(teacher, params):
+    """Per-quiz totals for a teacher's quizzes, read from the rollups rather than QuizAttempt"""
+    stats = filter_daily_stats(QuizDailyStats.objects.filter(quiz__created_by=teacher), params)
+    rows = stats.values('quiz_id', 'quiz__name').annotate(
+        attempts=Sum('attempt_count'),
+        offline=Sum('offline_count'),
+        total_score=Sum('score_sum'),
+        **{f'bucket_{i}_total': Sum(f'bucket_{i}') for i in range(BUCKET_COUNT)}
+    ).order_by('quiz__name', 'quiz_id')
+
+    quizzes = [
+        {
+            'quiz_id': row['quiz_id'],
+            'quiz_name': row['quiz__name'],
+            'attempt_count': row['attempts'],
+            'average_score': round(row['total_score'] / row['attempts'], 2) if row['attempts'] else 0,
+            'offline_share': round(row['offline'] / row['attempts'], 4) if row['attempts'] else 0,
+            'distribution': [row[f'bucket_{i}_total'] for i in range(BUCKET_COUNT)],
+        }
+        for row in rows
+    ]
+
+    attempts = sum(quiz['attempt_count'] for quiz in quizzes)
+    student_stats = StudentQuizStats.objects.filter(quiz__created_by=teacher)
+    if params.get('quiz_id'):
+        student_stats = student_stats.filter(quiz_id=params.get('quiz_id'))
+    summary = {
+        'totals': {
+            'attempt_count': attempts,
+            'average_score': round(sum(row['total_score'] for row in rows) / attempts, 2) if attempts else 0,
+            # Like best scores, the student count is all-time; the rollups keep no per-day student rows
+            'student_count': student_stats.values('student_id').distinct().count(),
+            'distribution': [sum(quiz['distribution'][i] for quiz in quizzes) for i in range(BUCKET_COUNT)],
+        },
+        'quizzes': quizzes,
+    }
+    if params.get('quiz_id'):
+        # Best scores are all-time, the date range only narrows the daily totals
+        summary['students'] = [
+            {
+                'student_id': row['student_id'],
+                'student_name': f"{row['student__user__first_name']} {row['student__user__last_name']}".strip(),
+                'best_score': row['best_score'],
+                'attempt_count': row['attempt_count'],
+                'offline_count': row['offline_count'],
+                'offline_share': round(row['offline_count'] / row['attempt_count'], 4) if row['attempt_count'] else 0,
+                'last_attempt_at': row['last_attempt_at'],
+            }
+            for row in StudentQuizStats.objects.filter(
+                quiz__created_by=teacher, quiz_id=params.get('quiz_id')
+            ).values(
+                'student_id', 'student__user__first_name', 'student__user__last_name',
+                'best_score', 'attempt_count', 'offline_count', 'last_attempt_at'
+            ).order_by('-best_score', 'student_id')
+        ]
+    return summary
@@ -152,18 +152,18 @@ class ClassRoomSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'teacher', 'student_count', 'active_students_count', 'inactive_students_count', 'average_progress', 'enrollments']
 
 
-    # Add these method fields
+    # Classrooms loaded with ClassRoom.objects.with_stats() carry these as annotations
     def get_student_count(self, obj):
-        return obj.student_count()
+        return obj.num_students if hasattr(obj, 'num_students') else obj.student_count()
 
     def get_active_students_count(self, obj):
-        return obj.active_students_count()
+        return obj.num_active_students if hasattr(obj, 'num_active_students') else obj.active_students_count()
 
     def get_inactive_students_count(self, obj):
-        return obj.inactive_students_count()
+        return obj.num_inactive_students if hasattr(obj, 'num_inactive_students') else obj.inactive_students_count()
 
     def get_average_progress(self, obj):
-        return obj.average_progress()
+        return obj.avg_progress if hasattr(obj, 'avg_progress') else obj.average_progress()
 
 class MyProgressSerializer(serializers.ModelSerializer):
     """
@@ -218,25 +218,20 @@ class VideoSerializer(serializers.ModelSerializer):
         
         return obj.get_video_url(language)
     
-    def get_is_completed(self, obj):
+    def get_progress(self, obj):
+        """The requesting student's VideoProgress for obj, if any"""
         request = self.context.get('request')
         if request and hasattr(request.user, 'student'):
-            try:
-                progress = VideoProgress.objects.get(student=request.user.student, video=obj)
-                return progress.completed
-            except VideoProgress.DoesNotExist:
-                return False
-        return False
+            return VideoProgress.objects.filter(student=request.user.student, video=obj).first()
+        return None
+
+    def get_is_completed(self, obj):
+        progress = self.get_progress(obj)
+        return progress.completed if progress else False
     
     def get_progress_percentage(self, obj):
-        request = self.context.get('request')
-        if request and hasattr(request.user, 'student'):
-            try:
-                progress = VideoProgress.objects.get(student=request.user.student, video=obj)
-                return progress.completion_percentage
-            except VideoProgress.DoesNotExist:
-                return 0.0
-        return 0.0
+        progress = self.get_progress(obj)
+        return progress.completion_percentage if progress else 0.0
 
 class VideoProgressSerializer(serializers.ModelSerializer):
     video_title = serializers.CharField(source='video.title', read_only=True)
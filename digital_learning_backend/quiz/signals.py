@@ -0,0 +1,88 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+
+from .models import Quiz, Question, QuizAttempt, Student, Teacher, Video, VideoCategory
+from .authentication import forget_token, forget_user_tokens
+from .catalog import VIDEOS, bump_catalog_generation
+from .grading import invalidate_answer_key
+from .offline import refresh_quiz_content, refresh_video_content
+from .rollups import record_attempts
+
+
+@receiver([post_save, post_delete], sender=Quiz)
+def refresh_offline_quiz(sender, instance, **kwargs):
+    refresh_quiz_content(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Question)
+def refresh_quiz_on_question_change(sender, instance, **kwargs):
+    """Questions ship inside their quiz, so any question edit is a new quiz revision"""
+    Quiz.objects.filter(pk=instance.quiz_id).update(updated_at=timezone.now())
+    invalidate_answer_key(instance.quiz_id)
+    refresh_quiz_content(instance.quiz_id)
+
+
+@receiver([post_save, post_delete], sender=Quiz)
+@receiver([post_save, post_delete], sender=Question)
+@receiver([post_save, post_delete], sender=Teacher)
+def invalidate_quiz_catalog(sender, **kwargs):
+    """The cached catalog nests questions and the creating teacher"""
+    bump_catalog_generation()
+
+
+@receiver(post_save, sender=User)
+def invalidate_quiz_catalog_on_teacher_rename(sender, instance, update_fields=None, **kwargs):
+    # Logins only touch last_login, which the catalog does not show
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    if hasattr(instance, 'teacher'):
+        bump_catalog_generation()
+
+
+@receiver([post_save, post_delete], sender=Video)
+def refresh_offline_video(sender, instance, **kwargs):
+    refresh_video_content(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Video)
+@receiver([post_save, post_delete], sender=VideoCategory)
+def invalidate_video_catalog(sender, **kwargs):
+    """Cached category listings include per-category video counts"""
+    bump_catalog_generation(VIDEOS)
+
+
+@receiver(post_save, sender=VideoCategory)
+def refresh_offline_videos_on_category_change(sender, instance, **kwargs):
+    for video_id in instance.videos.values_list('id', flat=True):
+        refresh_video_content(video_id)
+
+
+@receiver(post_save, sender=QuizAttempt)
+def record_attempt_rollups(sender, instance, created, **kwargs):
+    """Bulk-created attempts (offline sync) are recorded by their caller instead"""
+    if created:
+        record_attempts([instance])
+
+
+@receiver(post_delete, sender=Token)
+def evict_deleted_token(sender, instance, **kwargs):
+    """logout_view deletes the token; the cached authentication must go with it"""
+    forget_token(instance.key)
+
+
+@receiver(post_save, sender=User)
+def evict_cached_user(sender, instance, update_fields=None, **kwargs):
+    # A deactivation or rename must not be served from the auth cache; logins only touch last_login
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    forget_user_tokens(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Student)
+@receiver([post_save, post_delete], sender=Teacher)
+def evict_cached_profile(sender, instance, **kwargs):
+    """The cached authentication carries the user's Student/Teacher profile"""
+    forget_user_tokens(instance.user_id)
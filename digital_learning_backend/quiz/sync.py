@@ -0,0 +1,154 @@
+import json
+import uuid
+
+from django.db import IntegrityError, transaction
+
+from .grading import get_answer_key, grade_batch
+from .models import Quiz, QuizAttempt, AttemptCounter
+from .rollups import record_attempts
+
+
+def answers_key(answers):
+    return json.dumps(answers, sort_keys=True)
+
+
+def parse_quiz_id(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_client_attempt_id(value):
+    """Return the client attempt UUID (None when absent); raises ValueError if malformed"""
+    if value in (None, ''):
+        return None
+    return uuid.UUID(str(value))
+
+
+def find_duplicate_attempt(student, client_attempt_id):
+    """The attempt already stored for this client_attempt_id, if any"""
+    if not client_attempt_id:
+        return None
+    return QuizAttempt.objects.filter(student=student, client_attempt_id=client_attempt_id).first()
+
+
+def sync_attempts(student, offline_attempts):
+    """Store a batch of offline quiz attempts for one student.
+
+    Quizzes are resolved in one query and retried uploads are recognised by
+    their client_attempt_id with one indexed lookup. Attempts from older
+    clients without an id fall back to matching stored answers. Attempt
+    numbers are reserved per quiz from AttemptCounter, attempts are graded
+    on the server against each quiz's answer key (loaded once per call, the
+    client's own score is ignored) and the batch is written with a single
+    bulk_create, then folded into the dashboard rollups. If a concurrent
+    upload of the same attempts wins the insert, the batch is retried once
+    and its duplicates are skipped. Returns (results, errors), one result
+    per stored attempt.
+    """
+    errors = []
+    attempts_data = []
+    for attempt_data in offline_attempts:
+        # A malformed item is reported on its own rather than failing the whole batch
+        if isinstance(attempt_data, dict):
+            attempts_data.append(attempt_data)
+        else:
+            errors.append(f"Failed to sync attempt: expected an object, got {type(attempt_data).__name__}")
+
+    quiz_ids = {parse_quiz_id(attempt_data.get('quiz_id')) for attempt_data in attempts_data}
+    quizzes = Quiz.objects.in_bulk(quiz_ids - {None})
+
+    pending = []
+    for attempt_data in attempts_data:
+        quiz = quizzes.get(parse_quiz_id(attempt_data.get('quiz_id')))
+        if quiz is None:
+            errors.append(f"Failed to sync attempt: Quiz {attempt_data.get('quiz_id')} does not exist")
+            continue
+        try:
+            client_attempt_id = parse_client_attempt_id(attempt_data.get('client_attempt_id'))
+        except ValueError:
+            errors.append(f"Failed to sync attempt: '{attempt_data.get('client_attempt_id')}' is not a valid client_attempt_id")
+            continue
+        pending.append((quiz, client_attempt_id, attempt_data))
+
+    answer_keys = {quiz.id: get_answer_key(quiz) for quiz, _, _ in pending}
+    try:
+        results = store_attempts(student, pending, answer_keys)
+    except IntegrityError:
+        # A concurrent upload of the same attempts committed between the
+        # duplicate check and the insert (possible under READ COMMITTED);
+        # everything was rolled back, and the retry's check sees its rows
+        results = store_attempts(student, pending, answer_keys)
+    return results, errors
+
+
+def stored_attempt_keys(student, client_ids, legacy_quiz_ids):
+    """Keys of the student's stored attempts: client ids, and (quiz id, answers) for legacy uploads"""
+    seen = set()
+    if client_ids:
+        seen.update(
+            QuizAttempt.objects.filter(
+                student=student, client_attempt_id__in=client_ids
+            ).values_list('client_attempt_id', flat=True)
+        )
+
+    if legacy_quiz_ids:
+        seen.update(
+            (quiz_id, answers_key(answers))
+            for quiz_id, answers in QuizAttempt.objects.filter(
+                student=student, quiz_id__in=legacy_quiz_ids, offline_attempt=True
+            ).values_list('quiz_id', 'answers')
+        )
+    return seen
+
+
+def store_attempts(student, pending, answer_keys):
+    """Number, grade and insert the attempts not stored yet, in one transaction; returns their results"""
+    client_ids = {client_attempt_id for _, client_attempt_id, _ in pending if client_attempt_id}
+    legacy_quiz_ids = {quiz.id for quiz, client_attempt_id, _ in pending if not client_attempt_id}
+
+    with transaction.atomic():
+        seen = stored_attempt_keys(student, client_ids, legacy_quiz_ids)
+
+        new_attempts = []
+        for quiz, client_attempt_id, attempt_data in pending:
+            answers = attempt_data.get('answers', {})
+            key = client_attempt_id or (quiz.id, answers_key(answers))
+            if key in seen:
+                continue
+            seen.add(key)
+
+            new_attempts.append(QuizAttempt(
+                student=student,
+                quiz=quiz,
+                answers=answers,
+                offline_attempt=True,
+                is_synced=True,
+                client_attempt_id=client_attempt_id
+            ))
+
+        # One counter reservation and one grading pass per quiz covers all of
+        # its new attempts; sorted so concurrent syncs lock counters in the same order
+        results = []
+        for quiz_id in sorted({attempt.quiz_id for attempt in new_attempts}):
+            attempts = [attempt for attempt in new_attempts if attempt.quiz_id == quiz_id]
+            first = AttemptCounter.reserve(student.id, quiz_id, len(attempts))
+            scores = grade_batch(answer_keys[quiz_id], [attempt.answers for attempt in attempts])
+
+            for offset, (attempt, (correct_count, score)) in enumerate(zip(attempts, scores)):
+                attempt.attempt_number = first + offset
+                attempt.score = score
+                results.append({
+                    'quiz_id': str(quiz_id),
+                    'client_attempt_id': str(attempt.client_attempt_id) if attempt.client_attempt_id else None,
+                    'attempt_number': attempt.attempt_number,
+                    'score': score,
+                    'correct_answers': correct_count,
+                    'total_questions': len(answer_keys[quiz_id])
+                })
+
+        QuizAttempt.objects.bulk_create(new_attempts)
+        record_attempts(new_attempts)
+
+    return results
@@ -4,6 +4,7 @@ from .views import (
     QuizViewSet,
     QuizSubmissionView,
     TeacherDashboardView,
+    DashboardSummaryView,
     ClassRoomViewSet,
     ClassDetailView,
     VideoCategoriesView,
@@ -11,6 +12,8 @@ from .views import (
     VideoListView,
     VideoProgressView,
     export_progress,
+    export_progress_ndjson,
+    export_progress_parquet,
     login_view,
     logout_view,
     my_progress_view,
@@ -41,8 +44,11 @@ urlpatterns = [
     
     # Enhanced API endpoints with date range support
     path('dashboard/', TeacherDashboardView.as_view(), name='teacher-dashboard'),
+    path('dashboard/summary/', DashboardSummaryView.as_view(), name='teacher-dashboard-summary'),
     path('my-progress/', my_progress_view, name='my-progress'),
     path('export/', export_progress, name='export-progress'),
+    path('export/ndjson/', export_progress_ndjson, name='export-progress-ndjson'),
+    path('export/parquet/', export_progress_parquet, name='export-progress-parquet'),
 
     # Authentication and registration endpoints
     path('auth/login/', login_view, name='api-login'),
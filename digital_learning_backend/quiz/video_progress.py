@@ -0,0 +1,125 @@
+import threading
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .flusher import register_flush
+from .models import Video, VideoProgress
+
+# Share of a video watched at which it counts as completed
+COMPLETION_THRESHOLD = 80
+
+# Heartbeats waiting to be written, coalesced per (student_id, video_id)
+_pending = {}
+_pending_lock = threading.Lock()
+
+
+def record_heartbeat(student_id, video_id, watch_time_seconds, completion_percentage, language=None):
+    """Buffer one progress heartbeat and return the coalesced progress for the video.
+
+    Watch time and completion keep their maximum and a video once completed
+    stays completed, so a heartbeat that arrives late (from another tab, or
+    buffered on another worker) cannot set progress back; language keeps
+    the latest value.
+    Nothing is written here: the background flusher writes the buffer every
+    WRITE_BEHIND_FLUSH_SECONDS, and a heartbeat that completes the video
+    flushes it straight away so completion is never delayed.
+    """
+    completed = completion_percentage >= COMPLETION_THRESHOLD
+
+    with _pending_lock:
+        entry = _pending.setdefault(
+            (student_id, video_id),
+            {'watch_time_seconds': 0, 'completion_percentage': 0, 'completed': False, 'language': None}
+        )
+        entry['watch_time_seconds'] = max(entry['watch_time_seconds'], watch_time_seconds)
+        entry['completion_percentage'] = max(entry['completion_percentage'], completion_percentage)
+        entry['completed'] = entry['completed'] or completed
+        if language:
+            entry['language'] = language
+        progress = dict(entry, video=video_id)
+
+    if completed or not settings.WRITE_BEHIND_FLUSH_SECONDS:
+        flush_video_progress()
+    else:
+        register_flush(flush_video_progress)
+    return progress
+
+
+def flush_video_progress():
+    """Write every buffered heartbeat in one transaction; returns the number of rows written"""
+    with _pending_lock:
+        batch = dict(_pending)
+        _pending.clear()
+    if not batch:
+        return 0
+
+    try:
+        write_progress(batch)
+    except Exception:
+        # Put the batch back (newer heartbeats win) so the next flush retries it
+        with _pending_lock:
+            for key, entry in batch.items():
+                if key in _pending:
+                    newer = _pending[key]
+                    newer['watch_time_seconds'] = max(newer['watch_time_seconds'], entry['watch_time_seconds'])
+                    newer['completion_percentage'] = max(newer['completion_percentage'], entry['completion_percentage'])
+                    newer['completed'] = newer['completed'] or entry['completed']
+                    newer['language'] = newer['language'] or entry['language']
+                else:
+                    _pending[key] = entry
+        raise
+    return len(batch)
+
+
+def write_progress(batch):
+    now = timezone.now()
+    student_ids = {student_id for student_id, _ in batch}
+    video_ids = {video_id for _, video_id in batch}
+
+    with transaction.atomic():
+        # Videos deleted since the heartbeat was buffered are dropped
+        video_ids = set(Video.objects.filter(id__in=video_ids).values_list('id', flat=True))
+        batch = {key: entry for key, entry in batch.items() if key[1] in video_ids}
+
+        existing = {
+            (progress.student_id, progress.video_id): progress
+            for progress in VideoProgress.objects.select_for_update().filter(
+                student_id__in=student_ids, video_id__in=video_ids
+            )
+            if (progress.student_id, progress.video_id) in batch
+        }
+
+        for key, progress in existing.items():
+            apply_heartbeat(progress, batch[key], now)
+        VideoProgress.objects.bulk_update(
+            existing.values(),
+            ['watch_time_seconds', 'completion_percentage', 'completed', 'preferred_language', 'last_watched']
+        )
+
+        created = [
+            apply_heartbeat(VideoProgress(student_id=student_id, video_id=video_id, watch_time_seconds=0), entry, now)
+            for (student_id, video_id), entry in batch.items()
+            if (student_id, video_id) not in existing
+        ]
+        try:
+            with transaction.atomic():
+                VideoProgress.objects.bulk_create(created)
+        except IntegrityError:
+            # Another worker created some of these rows since they were read
+            for progress in created:
+                row, _ = VideoProgress.objects.select_for_update().get_or_create(
+                    student_id=progress.student_id, video_id=progress.video_id
+                )
+                apply_heartbeat(row, batch[(progress.student_id, progress.video_id)], now).save()
+
+
+def apply_heartbeat(progress, entry, now):
+    # Other workers flush their own buffers, so the stored row may already be further along than this entry
+    progress.watch_time_seconds = max(progress.watch_time_seconds, entry['watch_time_seconds'])
+    progress.completion_percentage = max(progress.completion_percentage, entry['completion_percentage'])
+    progress.completed = progress.completed or entry['completed']
+    progress.preferred_language = entry['language'] or progress.preferred_language
+    progress.last_watched = now
+    return progress
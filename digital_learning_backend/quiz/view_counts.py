@@ -0,0 +1,49 @@
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.db.models import Case, F, IntegerField, Value, When
+
+from .flusher import register_flush
+from .models import Video
+
+# Views not yet added to Video.view_count, per video id
+_pending = Counter()
+_pending_lock = threading.Lock()
+
+
+def record_view(video_id):
+    """Count one view; the increment is applied by the background flusher"""
+    with _pending_lock:
+        _pending[video_id] += 1
+
+    if not settings.WRITE_BEHIND_FLUSH_SECONDS:
+        flush_view_counts()
+    else:
+        register_flush(flush_view_counts)
+
+
+def flush_view_counts():
+    """Add the buffered views with one UPDATE; returns the number of videos updated.
+
+    The increment happens in SQL (view_count + n), so concurrent workers never
+    lose each other's views, and .update() does not fire Video's post_save
+    (which would rebuild its offline content).
+    """
+    with _pending_lock:
+        counts = dict(_pending)
+        _pending.clear()
+    if not counts:
+        return 0
+
+    try:
+        Video.objects.filter(pk__in=counts).update(view_count=F('view_count') + Case(
+            *[When(pk=video_id, then=Value(count)) for video_id, count in counts.items()],
+            default=Value(0),
+            output_field=IntegerField()
+        ))
+    except Exception:
+        with _pending_lock:
+            _pending.update(counts)
+        raise
+    return len(counts)
@@ -8,10 +8,10 @@ from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, AllowAny
 from django.views.decorators.csrf import csrf_exempt  # ADD THIS
 from django.utils.decorators import method_decorator  # ADD THIS
-import csv
-from django.http import HttpResponse
-from django.utils.dateparse import parse_date
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
 from django.utils import timezone
+from django.db import IntegrityError
+from django.db.models import Q
 import uuid
 
 # Models import
@@ -22,10 +22,25 @@ from .models import (
 )
 from .serializers import (
     QuizSerializer, QuestionSerializer, StudentSerializer, TeacherSerializer, VideoCategorySerializer, 
-    VideoSerializer, VideoProgressSerializer, BadgeSerializer, QuizAttemptSerializer, ClassRoomSerializer, 
-    EnrollmentSerializer, StudentProgressSerializer, StudentRegistrationSerializer,
+    VideoSerializer, BadgeSerializer, QuizAttemptSerializer, ClassRoomSerializer, 
+    EnrollmentSerializer, StudentRegistrationSerializer,
     TeacherRegistrationSerializer, UserSerializer, MyProgressSerializer, ErrorSerializer
 )
+from .offline import (
+    build_offline_content, bundle_etag, current_content_version, datetime_to_version, etag_matches,
+    get_offline_bundle, negotiate_encoding, parse_cursor
+)
+from .catalog import OFFLINE, VIDEOS, cached_catalog, cached_json_response
+from .exports import (
+    filter_attempts, pyarrow, stream_progress_csv, stream_progress_ndjson, write_progress_parquet
+)
+from .grading import get_answer_key, grade
+from .pagination import paginate_attempts, parse_page_size
+from .read_serializers import ATTEMPT_VALUES, classroom_rows, quiz_rows, student_progress_rows, video_rows
+from .rollups import dashboard_summary
+from .sync import find_duplicate_attempt, parse_client_attempt_id, sync_attempts
+from .video_progress import record_heartbeat
+from .view_counts import record_view
 
 # ========== AUTHENTICATION VIEWS (FIXED) ==========
 
@@ -126,6 +141,7 @@ def my_progress_view(request):
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def logout_view(request):
+    # Deleting the token also evicts its cached authentication (quiz/signals.py)
     request.user.auth_token.delete()
     return Response({'message': 'Successfully logged out'})
 
@@ -136,20 +152,26 @@ class QuizViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     def get_queryset(self):
-        return Quiz.objects.filter(offline_available=True).prefetch_related('questions')
+        return Quiz.objects.filter(offline_available=True).select_related('created_by__user').prefetch_related('questions')
 
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({
-            'quizzes': serializer.data
-        })
+        # Serialized and encoded once per catalog generation (see quiz/catalog.py)
+        return cached_json_response('list', lambda: {'quizzes': quiz_rows(self.get_queryset())})
     
     def retrieve(self, request, pk=None):
-        queryset = self.get_queryset()
-        quiz = get_object_or_404(queryset, pk=pk)
-        serializer = self.get_serializer(quiz)
-        return Response({"quiz": serializer.data})
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+        def build():
+            quizzes = quiz_rows(self.get_queryset().filter(pk=pk))
+            return quizzes[0] if quizzes else None
+
+        quiz = cached_catalog(f'quiz:{pk}', build)
+        if quiz is None:
+            return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
+        return Response({"quiz": quiz})
 
 @method_decorator(csrf_exempt, name='dispatch')  # ADD THIS
 class QuizSubmissionView(APIView):
@@ -162,30 +184,49 @@ class QuizSubmissionView(APIView):
             answers = request.data.get('answers', {})
             offline_mode = request.data.get('offline_mode', False)
 
+            try:
+                client_attempt_id = parse_client_attempt_id(request.data.get('client_attempt_id'))
+            except ValueError:
+                return Response({'error': 'Invalid client_attempt_id'}, status=status.HTTP_400_BAD_REQUEST)
+
             quiz = get_object_or_404(Quiz, id=quiz_id)
             student = request.user.student
 
             # Calculate score
-            correct_count = 0
-            total_questions = quiz.questions.count()
-
-            for question in quiz.questions.all():
-                student_answer = answers.get(str(question.id))
-                if student_answer and student_answer == question.correct_answer:
-                    correct_count += 1
-
-            score = (correct_count / total_questions * 100) if total_questions > 0 else 0
-
-            # CREATE attempt with offline support
-            attempt = QuizAttempt(
-                student=student,
-                quiz=quiz,
-                answers=answers,
-                score=score,
-                offline_attempt=offline_mode,
-                is_synced=not offline_mode
-            )
-            attempt.save()
+            correct_count, total_questions, score = grade(get_answer_key(quiz), answers)
+
+            # A retried upload of an attempt we already stored is a no-op
+            existing = find_duplicate_attempt(student, client_attempt_id)
+            if existing is None:
+                # CREATE attempt with offline support
+                attempt = QuizAttempt(
+                    student=student,
+                    quiz=quiz,
+                    answers=answers,
+                    score=score,
+                    offline_attempt=offline_mode,
+                    is_synced=not offline_mode,
+                    client_attempt_id=client_attempt_id
+                )
+                try:
+                    attempt.save()
+                except IntegrityError:
+                    # A concurrent retry of the same attempt was stored first
+                    existing = find_duplicate_attempt(student, client_attempt_id)
+                    if existing is None:
+                        raise
+
+            if existing:
+                return Response({
+                    'attempt_number': existing.attempt_number,
+                    'score': existing.score,
+                    'correct_answers': correct_count,
+                    'total_questions': total_questions,
+                    'badges_earned': [],
+                    'offline_mode': existing.offline_attempt,
+                    'sync_status': 'synced' if existing.is_synced else 'pending',
+                    'duplicate': True
+                }, status=status.HTTP_200_OK)
 
             # Award badges
             badges_earned = []
@@ -227,59 +268,44 @@ class QuizSubmissionView(APIView):
 @permission_classes([AllowAny])
 @csrf_exempt  # ADD THIS
 def download_offline_content(request):
-    """Download all content for offline use"""
+    """Download content for offline use (only changes when `since`/`version` is given)"""
     try:
-        quizzes = Quiz.objects.filter(
-            is_active=True, 
-            offline_available=True
-        ).prefetch_related('questions')
-        
-        videos = Video.objects.filter(offline_available=True)
-        
-        offline_content = {
-            'quizzes': [],
-            'videos': [],
-            'sync_timestamp': timezone.now().isoformat(),
-            'version': 1
-        }
-        
-        for quiz in quizzes:
-            quiz_data = {
-                'id': str(quiz.id),
-                'name': quiz.name,
-                'subject': quiz.subject,
-                'time_limit': quiz.time_limit,
-                'questions': []
-            }
-            
-            for question in quiz.questions.all():
-                quiz_data['questions'].append({
-                    'id': str(question.id),
-                    'text_en': question.text_en,
-                    'text_pa': question.text_pa,
-                    'options': question.options,
-                })
-            
-            offline_content['quizzes'].append(quiz_data)
-        
-        for video in videos:
-            video_data = {
-                'id': str(video.id),
-                'title': video.title,
-                'title_pa': video.title_pa,
-                'description': video.description,
-                'category': video.category.category_type,
-                'difficulty': video.difficulty,
-                'duration_minutes': video.duration_minutes,
-                'video_urls': {
-                    'en': video.get_video_url('en'),
-                    'hi': video.get_video_url('hi'),
-                    'pa': video.get_video_url('pa'),
-                }
-            }
-            offline_content['videos'].append(video_data)
-        
-        return Response(offline_content)
+        since = parse_cursor(request.query_params)
+    except ValueError as e:
+        return Response({'error': f'Invalid sync cursor: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        version = current_content_version()
+        encoding = negotiate_encoding(request.headers.get('Accept-Encoding', '')) if since is None else 'identity'
+        etag = bundle_etag(version, since, encoding)
+
+        if etag_matches(etag, request.headers.get('If-None-Match')):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            if since is None:
+                response['Vary'] = 'Accept-Encoding'
+            return response
+
+        if since is not None:
+            # Identical cursors at the same version get the same delta, so its body is cached
+            response = cached_json_response(
+                f'delta:{version}:{datetime_to_version(since)}',
+                lambda: build_offline_content(since, version),
+                OFFLINE
+            )
+            response['ETag'] = etag
+            return response
+
+        # Full downloads are served from the stored, pre-compressed bundle
+        bodies = get_offline_bundle(version)
+
+        response = HttpResponse(bodies[encoding], content_type='application/json')
+        if encoding != 'identity':
+            response['Content-Encoding'] = encoding
+        response['ETag'] = etag
+        response['Vary'] = 'Accept-Encoding'
+        response['Cache-Control'] = 'no-cache'
+        return response
         
     except Exception as e:
         return Response({'error': f'Failed to download content: {str(e)}'}, status=500)
@@ -295,40 +321,65 @@ def submit_offline_quiz(request):
         offline_mode = request.data.get('offline_mode', False)
         student_id = request.data.get('student_id')
         
-        quiz = get_object_or_404(Quiz, id=quiz_id)
-        
-        correct_count = 0
-        total_questions = quiz.questions.count()
+        try:
+            client_attempt_id = parse_client_attempt_id(request.data.get('client_attempt_id'))
+        except ValueError:
+            return Response({'error': 'Invalid client_attempt_id'}, status=400)
         
-        for question in quiz.questions.all():
-            student_answer = answers.get(str(question.id))
-            if student_answer == question.correct_answer:
-                correct_count += 1
+        quiz = get_object_or_404(Quiz, id=quiz_id)
         
-        score = (correct_count / total_questions * 100) if total_questions > 0 else 0
+        correct_count, total_questions, score = grade(get_answer_key(quiz), answers)
         
         if request.user.is_authenticated and hasattr(request.user, 'student'):
-            attempt = QuizAttempt.objects.create(
-                student=request.user.student,
-                quiz=quiz,
-                answers=answers,
-                score=score,
-                offline_attempt=offline_mode,
-                is_synced=not offline_mode
-            )
+            student = request.user.student
+            # A retried upload of an attempt we already stored is a no-op
+            existing = find_duplicate_attempt(student, client_attempt_id)
+            if existing is None:
+                try:
+                    QuizAttempt.objects.create(
+                        student=student,
+                        quiz=quiz,
+                        answers=answers,
+                        score=score,
+                        offline_attempt=offline_mode,
+                        is_synced=not offline_mode,
+                        client_attempt_id=client_attempt_id
+                    )
+                except IntegrityError:
+                    # A concurrent retry of the same attempt was stored first
+                    existing = find_duplicate_attempt(student, client_attempt_id)
+                    if existing is None:
+                        raise
+
+            if existing:
+                return Response({
+                    'attempt_number': existing.attempt_number,
+                    'score': existing.score,
+                    'correct_answers': correct_count,
+                    'total_questions': total_questions,
+                    'badges_earned': [],
+                    'offline_mode': existing.offline_attempt,
+                    'sync_needed': False,
+                    'duplicate': True,
+                    'message': 'Quiz already submitted'
+                })
         elif offline_mode and student_id:
             try:
                 student = Student.objects.get(student_id=student_id)
-                offline_session = OfflineSession.objects.create(
-                    student=student,
-                    session_id=str(uuid.uuid4()),
-                    session_data={
-                        'quiz_id': str(quiz_id),
-                        'answers': answers,
-                        'score': score,
-                        'completed_at': timezone.now().isoformat()
-                    },
-                    is_synced=False
+                # Keying the session on the client id makes re-uploads idempotent
+                offline_session, _ = OfflineSession.objects.get_or_create(
+                    session_id=str(client_attempt_id or uuid.uuid4()),
+                    defaults={
+                        'student': student,
+                        'session_data': {
+                            'quiz_id': str(quiz_id),
+                            'answers': answers,
+                            'score': score,
+                            'completed_at': timezone.now().isoformat(),
+                            'client_attempt_id': str(client_attempt_id) if client_attempt_id else None
+                        },
+                        'is_synced': False
+                    }
                 )
             except Student.DoesNotExist:
                 return Response({'error': 'Student not found'}, status=404)
@@ -360,39 +411,14 @@ def sync_offline_attempts(request):
     """Sync offline quiz attempts when back online"""
     try:
         offline_attempts = request.data.get('offline_attempts', [])
-        synced_count = 0
-        errors = []
-        
         student = request.user.student
         
-        for attempt_data in offline_attempts:
-            try:
-                quiz_id = attempt_data.get('quiz_id')
-                quiz = Quiz.objects.get(id=quiz_id)
-                
-                existing = QuizAttempt.objects.filter(
-                    student=student,
-                    quiz=quiz,
-                    answers=attempt_data.get('answers', {}),
-                    offline_attempt=True
-                ).exists()
-                
-                if not existing:
-                    QuizAttempt.objects.create(
-                        student=student,
-                        quiz=quiz,
-                        answers=attempt_data.get('answers', {}),
-                        score=attempt_data.get('score', 0),
-                        offline_attempt=True,
-                        is_synced=True
-                    )
-                    synced_count += 1
-                
-            except Exception as e:
-                errors.append(f"Failed to sync attempt: {str(e)}")
+        # Scores are computed on the server; any client-supplied score is ignored
+        results, errors = sync_attempts(student, offline_attempts)
+        synced_count = len(results)
         
         student.last_offline_sync = timezone.now()
-        student.save()
+        student.save(update_fields=['last_offline_sync'])
         
         SyncLog.objects.create(
             student=student,
@@ -403,6 +429,7 @@ def sync_offline_attempts(request):
         
         return Response({
             'synced_count': synced_count,
+            'results': results,
             'errors': errors,
             'message': f'Successfully synced {synced_count} offline attempts'
         })
@@ -470,25 +497,47 @@ class TeacherDashboardView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        quiz_id = request.query_params.get('quiz_id')
-        start_date = request.query_params.get('start_date')
-        end_date = request.query_params.get('end_date')
+        teacher = request.user.teacher
 
-        queryset = QuizAttempt.objects.select_related('student__user').prefetch_related('student__studentbadge_set__badge').all()
+        # Only attempts on this teacher's quizzes or by students in their classrooms
+        queryset = QuizAttempt.objects.filter(
+            Q(quiz__created_by=teacher) |
+            Q(student_id__in=Enrollment.objects.filter(classroom__teacher=teacher).values('student_id'))
+        ).values(*ATTEMPT_VALUES)
         
-        if quiz_id:
-            queryset = queryset.filter(quiz_id=quiz_id)
+        try:
+            queryset = filter_attempts(queryset, request.query_params)
+        except Exception as e:
+            return Response({'error': f'Invalid date format: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
         
-        if start_date and end_date:
-            try:
-                start = parse_date(start_date)
-                end = parse_date(end_date)
-                queryset = queryset.filter(completed_at__date__range=[start, end])
-            except Exception as e:
-                return Response({'error': f'Invalid date format: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            page_size = parse_page_size(request.query_params.get('page_size'))
+            attempts, next_cursor = paginate_attempts(queryset, request.query_params.get('cursor'), page_size)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
-        serializer = StudentProgressSerializer(queryset, many=True)
-        return Response(serializer.data)
+        return Response({
+            'results': student_progress_rows(attempts),
+            'next_cursor': next_cursor
+        })
+
+class DashboardSummaryView(APIView):
+    """Per-quiz totals and score distributions served from the precomputed rollups"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if not hasattr(request.user, 'teacher'):
+            return Response(
+                {'error': 'Only teachers can access this endpoint'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        try:
+            summary = dashboard_summary(request.user.teacher, request.query_params)
+        except ValueError as e:
+            return Response({'error': f'Invalid date format: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(summary)
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -499,38 +548,62 @@ def export_progress(request):
             status=status.HTTP_403_FORBIDDEN
         )
 
-    response = HttpResponse(content_type='text/csv')
+    try:
+        queryset = filter_attempts(QuizAttempt.objects.all(), request.query_params)
+    except Exception as e:
+        return Response({'error': f'Invalid date format: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+
+    # Streamed in chunks from a server-side iterator, so memory stays flat for large exports
+    response = StreamingHttpResponse(stream_progress_csv(queryset), content_type='text/csv')
     response['Content-Disposition'] = 'attachment; filename="student_progress.csv"'
+    return response
 
-    quiz_id = request.query_params.get('quiz_id')
-    start_date = request.query_params.get('start_date')
-    end_date = request.query_params.get('end_date')
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_progress_ndjson(request):
+    """Same filters as export_progress, as newline-delimited JSON for streaming ingestion"""
+    if not hasattr(request.user, 'teacher'):
+        return Response(
+            {'error': 'Only teachers can access this endpoint'},
+            status=status.HTTP_403_FORBIDDEN
+        )
 
-    queryset = QuizAttempt.objects.all()
-    if quiz_id:
-        queryset = queryset.filter(quiz_id=quiz_id)
-    
-    if start_date and end_date:
-        try:
-            start = parse_date(start_date)
-            end = parse_date(end_date)
-            queryset = queryset.filter(completed_at__date__range=[start, end])
-        except Exception as e:
-            return Response({'error': f'Invalid date format: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        queryset = filter_attempts(QuizAttempt.objects.all(), request.query_params)
+    except Exception as e:
+        return Response({'error': f'Invalid date format: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
 
-    writer = csv.writer(response)
-    writer.writerow(['Student', 'Quiz', 'Score', 'Completed At', 'Offline Mode'])
+    response = StreamingHttpResponse(stream_progress_ndjson(queryset), content_type='application/x-ndjson')
+    response['Content-Disposition'] = 'attachment; filename="student_progress.ndjson"'
+    return response
 
-    for attempt in queryset:
-        writer.writerow([
-            attempt.student.user.get_full_name(),
-            attempt.quiz.name,
-            attempt.score,
-            attempt.completed_at.strftime('%Y-%m-%d %H:%M:%S'),
-            'Yes' if attempt.offline_attempt else 'No'
-        ])
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_progress_parquet(request):
+    """Same filters as export_progress, as a typed Parquet file (requires pyarrow)"""
+    if not hasattr(request.user, 'teacher'):
+        return Response(
+            {'error': 'Only teachers can access this endpoint'},
+            status=status.HTTP_403_FORBIDDEN
+        )
 
-    return response
+    if pyarrow is None:
+        return Response(
+            {'error': 'Parquet export is not available on this server (pyarrow is not installed)'},
+            status=status.HTTP_501_NOT_IMPLEMENTED
+        )
+
+    try:
+        queryset = filter_attempts(QuizAttempt.objects.all(), request.query_params)
+    except Exception as e:
+        return Response({'error': f'Invalid date format: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+
+    return FileResponse(
+        write_progress_parquet(queryset),
+        as_attachment=True,
+        filename='student_progress.parquet',
+        content_type='application/vnd.apache.parquet'
+    )
 
 # ========== CLASS MANAGEMENT ==========
 
@@ -540,7 +613,7 @@ class ClassRoomViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         if hasattr(self.request.user, 'teacher'):
-            return ClassRoom.objects.filter(teacher=self.request.user.teacher).prefetch_related('enrollments')
+            return ClassRoom.objects.filter(teacher=self.request.user.teacher).with_stats()
         return ClassRoom.objects.none()
 
     def perform_create(self, serializer):
@@ -551,10 +624,8 @@ class ClassRoomViewSet(viewsets.ModelViewSet):
 
     def list(self, request, *args, **kwargs):
         try:
-            queryset = self.get_queryset()
-            serializer = self.get_serializer(queryset, many=True)
             return Response({
-                'classes': serializer.data
+                'classes': classroom_rows(self.get_queryset())
             })
         except Exception as e:
             return Response({
@@ -592,7 +663,7 @@ class ClassDetailView(APIView):
             )
         
         try:
-            classroom = get_object_or_404(ClassRoom, id=class_id, teacher=request.user.teacher)
+            classroom = get_object_or_404(ClassRoom.objects.with_stats(), id=class_id, teacher=request.user.teacher)
             serializer = ClassRoomSerializer(classroom)
             return Response(serializer.data)
         except Exception as e:
@@ -617,7 +688,7 @@ class VideoListView(APIView):
         category_type = request.query_params.get('category')
         difficulty = request.query_params.get('difficulty')
         
-        videos = Video.objects.all()
+        videos = Video.objects.select_related('category')
         
         if category_type:
             videos = videos.filter(category__category_type=category_type)
@@ -625,9 +696,16 @@ class VideoListView(APIView):
         if difficulty:
             videos = videos.filter(difficulty=difficulty)
         
-        serializer = VideoSerializer(videos, many=True, context={'request': request})
+        # Load the student's progress once instead of querying it per video
+        progress_map = {
+            video_id: (completed, completion_percentage)
+            for video_id, completed, completion_percentage in VideoProgress.objects.filter(
+                student=request.user.student
+            ).values_list('video_id', 'completed', 'completion_percentage')
+        }
+        
         return Response({
-            'videos': serializer.data
+            'videos': video_rows(videos, request.GET.get('lang', 'en'), progress_map)
         })
 
 @method_decorator(csrf_exempt, name='dispatch')  # ADD THIS
@@ -636,9 +714,9 @@ class VideoDetailView(APIView):
     
     def get(self, request, video_id):
         try:
-            video = get_object_or_404(Video, id=video_id)
-            video.view_count += 1
-            video.save()
+            video = get_object_or_404(Video.objects.select_related('category'), id=video_id)
+            # Counted in memory and added in batches, so this GET writes nothing
+            record_view(video.id)
             
             serializer = VideoSerializer(video, context={'request': request})
             return Response(serializer.data)
@@ -654,30 +732,31 @@ class VideoProgressView(APIView):
     permission_classes = [IsAuthenticated]
     
     def post(self, request, video_id):
+        """Heartbeats are buffered and written in batches (see quiz/video_progress.py)"""
         try:
-            video = get_object_or_404(Video, id=video_id)
+            if not Video.objects.filter(id=video_id).exists():
+                return Response({'error': 'Video not found'}, status=status.HTTP_404_NOT_FOUND)
             student = request.user.student
-            
-            progress, created = VideoProgress.objects.get_or_create(
-                student=student,
-                video=video,
-                defaults={
-                    'preferred_language': request.data.get('language', 'en')
-                }
+
+            try:
+                watch_time = int(request.data.get('watch_time_seconds', 0))
+                completion_percentage = float(request.data.get('completion_percentage', 0))
+            except (TypeError, ValueError):
+                return Response(
+                    {'error': 'watch_time_seconds and completion_percentage must be numbers'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            progress = record_heartbeat(
+                student.id, video_id, watch_time, completion_percentage, request.data.get('language')
             )
-            
-            watch_time = request.data.get('watch_time_seconds', 0)
-            completion_percentage = request.data.get('completion_percentage', 0)
-            
-            progress.watch_time_seconds = max(progress.watch_time_seconds, watch_time)
-            progress.completion_percentage = completion_percentage
-            progress.completed = completion_percentage >= 80
-            progress.preferred_language = request.data.get('language', progress.preferred_language)
-            
-            progress.save()
-            
-            serializer = VideoProgressSerializer(progress)
-            return Response(serializer.data)
+            return Response({
+                'video': progress['video'],
+                'watch_time_seconds': progress['watch_time_seconds'],
+                'completed': progress['completed'],
+                'completion_percentage': progress['completion_percentage'],
+                'preferred_language': progress['language'],
+            }, status=status.HTTP_202_ACCEPTED)
             
         except Exception as e:
             return Response(
@@ -690,11 +769,9 @@ class VideoCategoriesView(APIView):
     permission_classes = [IsAuthenticated]
     
     def get(self, request):
-        categories = VideoCategory.objects.all()
-        serializer = VideoCategorySerializer(categories, many=True)
-        return Response({
-            'categories': serializer.data
-        })
+        return cached_json_response('categories', lambda: {
+            'categories': VideoCategorySerializer(VideoCategory.objects.all(), many=True).data
+        }, VIDEOS)
 
 # ========== ADDITIONAL CLASS MANAGEMENT FUNCTIONS ==========
 
@@ -767,7 +844,7 @@ def class_detail_view(request, class_id):
     
     try:
         classroom = get_object_or_404(
-            ClassRoom, 
+            ClassRoom.objects.with_stats(),
             id=class_id, 
             teacher=request.user.teacher
         )
@@ -775,7 +852,7 @@ def class_detail_view(request, class_id):
         serializer = ClassRoomSerializer(classroom)
         data = serializer.data
         
-        enrollments = classroom.enrollments.all().select_related('student__user')
+        enrollments = classroom.enrollments.all()
         students_data = []
         
         for enrollment in enrollments:
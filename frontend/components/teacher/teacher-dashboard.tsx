@@ -40,6 +40,18 @@ interface StudentProgress {
   completed_at: string;
 }
 
+// Totals from /dashboard/summary/; distribution counts attempts in 20-point score buckets
+interface SummaryTotals {
+  attempt_count: number;
+  average_score: number;
+  student_count: number;
+  distribution: number[];
+}
+
+// Pass mark for the badges, on a distribution bucket boundary so the summary can count passes
+const PASSING_SCORE = 60;
+const PASSING_BUCKET = PASSING_SCORE / 20;
+
 interface ClassRoom {
   id: number;
   name: string;
@@ -83,6 +95,9 @@ export function TeacherDashboard() {
   // MERGED: Your existing state + your class management state
   const [language, setLanguage] = useState<"en" | "hi" | "pa">("en")
   const [studentProgress, setStudentProgress] = useState<StudentProgress[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [summaryTotals, setSummaryTotals] = useState<SummaryTotals | null>(null)
   const [classrooms, setClassrooms] = useState<ClassRoom[]>([])
   const [availableStudents, setAvailableStudents] = useState<Student[]>([])
   const [selectedClass, setSelectedClass] = useState<string>("all") // Keep your existing filter logic
@@ -131,25 +146,53 @@ export function TeacherDashboard() {
   }
 
   // MERGED: Fetch student progress data with date filtering (your friend's enhancement)
+  // The attempt list is cursor-paginated: only the first page is fetched here, the rest on "Load more".
+  // The stat cards come from the rollup summary, so they cover every attempt without downloading them.
   useEffect(() => {
+    let cancelled = false;
     const fetchStudentProgress = async () => {
       setLoading(true);
       try {
         const params: Record<string, string> = {};
         if (startDate) params.start_date = startDate;
         if (endDate) params.end_date = endDate;
-        const response = await api.get('/dashboard/', { params });
-        setStudentProgress(response.data);
+        const [progressResponse, summaryResponse] = await Promise.all([
+          api.get('/dashboard/', { params }),
+          api.get('/dashboard/summary/', { params }),
+        ]);
+        if (cancelled) return;
+        setStudentProgress(progressResponse.data.results);
+        setNextCursor(progressResponse.data.next_cursor);
+        setSummaryTotals(summaryResponse.data.totals);
       } catch (error) {
         console.error("Failed to fetch student progress:", error);
         toast({ title: "Error", description: "Could not load student data.", variant: "destructive" });
       } finally {
-        setLoading(false);
+        if (!cancelled) setLoading(false);
       }
     };
     fetchStudentProgress();
+    return () => { cancelled = true; };
   }, [toast, startDate, endDate]); // MERGED: Added startDate, endDate dependencies
 
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const params: Record<string, string> = { cursor: nextCursor };
+      if (startDate) params.start_date = startDate;
+      if (endDate) params.end_date = endDate;
+      const response = await api.get('/dashboard/', { params });
+      setStudentProgress(prev => [...prev, ...response.data.results]);
+      setNextCursor(response.data.next_cursor);
+    } catch (error) {
+      console.error("Failed to fetch more student progress:", error);
+      toast({ title: "Error", description: "Could not load more submissions.", variant: "destructive" });
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // YOUR: Fetch classrooms when classes tab is active
   useEffect(() => {
     const fetchClassrooms = async () => {
@@ -351,11 +394,12 @@ export function TeacherDashboard() {
   const filteredStudents = studentProgress.filter(student =>
     student.student_name.toLowerCase().includes(searchTerm.toLowerCase())
   );
-  const uniqueStudentsCount = new Set(studentProgress.map(s => s.student_name)).size;
-  const strugglingStudentsCount = studentProgress.filter(s => s.score < 70).length;
-  const averageScore = studentProgress.length > 0
-    ? studentProgress.reduce((acc, s) => acc + s.score, 0) / studentProgress.length
-    : 0;
+  const distribution = summaryTotals?.distribution ?? [];
+  const uniqueStudentsCount = summaryTotals?.student_count ?? 0;
+  const totalSubmissionsCount = summaryTotals?.attempt_count ?? 0;
+  const strugglingStudentsCount = distribution.slice(0, PASSING_BUCKET).reduce((acc, count) => acc + count, 0);
+  const passingStudentsCount = distribution.slice(PASSING_BUCKET).reduce((acc, count) => acc + count, 0);
+  const averageScore = summaryTotals?.average_score ?? 0;
 
   return (
     <div className="min-h-screen bg-background">
@@ -442,7 +486,7 @@ export function TeacherDashboard() {
                   <BookOpen className="h-4 w-4 text-muted-foreground" />
                 </CardHeader>
                 <CardContent>
-                  <div className="text-2xl font-bold text-success">{studentProgress.length}</div>
+                  <div className="text-2xl font-bold text-success">{totalSubmissionsCount}</div>
                 </CardContent>
               </Card>
               <Card>
@@ -511,8 +555,8 @@ export function TeacherDashboard() {
                             <td className="p-4 text-right font-bold">{attempt.score.toFixed(0)}%</td>
                             <td className="p-4 text-muted-foreground">{new Date(attempt.completed_at).toLocaleString()}</td>
                             <td className="p-4 text-center">
-                              <Badge variant={attempt.score >= 70 ? 'default' : 'destructive'}>
-                                {attempt.score >= 70 ? 'Passed' : 'Failed'}
+                              <Badge variant={attempt.score >= PASSING_SCORE ? 'default' : 'destructive'}>
+                                {attempt.score >= PASSING_SCORE ? 'Passed' : 'Failed'}
                               </Badge>
                             </td>
                           </tr>
@@ -521,6 +565,16 @@ export function TeacherDashboard() {
                     </tbody>
                   </table>
                 </div>
+                {nextCursor && !loading && (
+                  <div className="flex justify-center p-4 border-t">
+                    <Button variant="outline" onClick={handleLoadMore} disabled={loadingMore}>
+                      {loadingMore
+                        ? getText("Loading...", "लोड हो रहा है...", "ਲੋਡ ਹੋ ਰਿਹਾ ਹੈ...")
+                        : getText("Load more", "और लोड करें", "ਹੋਰ ਲੋਡ ਕਰੋ")
+                      }
+                    </Button>
+                  </div>
+                )}
               </CardContent>
             </Card>
           </TabsContent>
@@ -708,7 +762,7 @@ export function TeacherDashboard() {
                         <div className="w-3 h-3 bg-success rounded-full"></div>
                         <span className="text-sm">{getText("Passing Students", "उत्तीर्ण छात्र", "ਪਾਸ ਵਿਦਿਆਰਥੀ")}</span>
                       </div>
-                      <span className="font-medium">{studentProgress.filter(s => s.score >= 70).length}</span>
+                      <span className="font-medium">{passingStudentsCount}</span>
                     </div>
                     <div className="flex items-center justify-between">
                       <div className="flex items-center gap-2">
@@ -758,8 +812,8 @@ export function TeacherDashboard() {
                             <td className="p-2">{student.score.toFixed(0)}%</td>
                             <td className="p-2">{new Date(student.completed_at).toLocaleDateString()}</td>
                             <td className="p-2">
-                              <Badge variant={student.score >= 70 ? "default" : "destructive"}>
-                                {student.score >= 70 
+                              <Badge variant={student.score >= PASSING_SCORE ? "default" : "destructive"}>
+                                {student.score >= PASSING_SCORE 
                                   ? getText("Passed", "उत्तीर्ण", "ਪਾਸ") 
                                   : getText("Failed", "अनुत्तीर्ण", "ਫੇਲ੍ਹ")
                                 }